@@ -12,6 +12,8 @@ Checks:
 Enhanced with Memori integration for historical violation tracking.
 """
 
+import bisect
+import json
 import os
 import re
 import sys
@@ -28,6 +30,9 @@ except ImportError:
     MEMORI_AVAILABLE = False
     print("⚠️  Memori SDK not available - running without historical context")
 
+SKILL_DIR = Path(__file__).resolve().parent.parent
+VALIDATION_CACHE_PATH = SKILL_DIR / 'generated' / '.validation-cache.json'
+
 # Color codes for output
 GREEN = '\033[92m'
 RED = '\033[91m'
@@ -35,14 +40,87 @@ YELLOW = '\033[93m'
 BLUE = '\033[94m'
 RESET = '\033[0m'
 
+# Anti-pattern and README section patterns, compiled once at import
+CLASS_SERVICE_PATTERN = re.compile(r'export\s+class\s+\w+Service')
+RETURNTYPE_PATTERN = re.compile(r'ReturnType<typeof\s+create\w+Service>')
+SUPABASE_ANY_PATTERN = re.compile(r'supabase:\s*any')
+README_SECTION_PATTERNS = {
+    'Bounded Context': re.compile(r'>\s*\*\*Bounded Context\*\*:'),
+    'SRM Reference': re.compile(r'>\s*\*\*SRM Reference\*\*:'),
+    'Pattern': re.compile(r'##\s*Pattern'),
+    'Ownership': re.compile(r'##\s*Ownership'),
+}
+ANTI_PATTERN_NAME = re.compile(r'ANTI-PATTERN:\s*([^.]+?)(?:\sdetected|\.|$)')
+FILE_LOCATION = re.compile(r'(\w+\.ts)(?::\d+)?')
+
+# (group name, pattern, error message, applies to .test.ts files)
+ANTI_PATTERN_RULES = [
+    ('class_service', CLASS_SERVICE_PATTERN,
+     "ANTI-PATTERN: Class-based service detected. Use functional factories instead.",
+     False),
+    ('returntype', RETURNTYPE_PATTERN,
+     "ANTI-PATTERN: ReturnType inference detected. Use explicit interface instead.",
+     True),
+    ('supabase_any', SUPABASE_ANY_PATTERN,
+     "Type safety violation: 'supabase: any' detected. "
+     "Use 'supabase: SupabaseClient<Database>' instead.",
+     False),
+]
+
+# Literals every rule needs; files containing none of them skip the regex scan
+ANTI_PATTERN_KEYWORDS = ('class', 'ReturnType', 'supabase')
+
+# Single alternation over all rules; m.lastgroup identifies the rule that fired
+ANTI_PATTERN_SCAN = re.compile(
+    '|'.join(f'(?P<{name}>{pattern.pattern})' for name, pattern, _, _ in ANTI_PATTERN_RULES)
+)
+
+
+def compute_line_starts(content: str) -> List[int]:
+    """Offsets at which each line of content begins (for bisecting line numbers)."""
+    line_starts = [0]
+    offset = content.find('\n')
+    while offset != -1:
+        line_starts.append(offset + 1)
+        offset = content.find('\n', offset + 1)
+    return line_starts
+
+
+def load_validation_cache() -> Dict:
+    """Load cached validation results keyed by resolved service path."""
+    try:
+        with open(VALIDATION_CACHE_PATH, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_validation_cache(cache: Dict) -> None:
+    """Write the validation cache atomically (temp file + rename)."""
+    tmp_path = VALIDATION_CACHE_PATH.with_suffix('.tmp')
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, VALIDATION_CACHE_PATH)
+    except OSError as e:
+        print(f"⚠️  Could not write validation cache: {e}")
+
+
 class ServiceValidator:
-    def __init__(self, service_path: str):
+    def __init__(self, service_path: str, use_cache: bool = True):
         self.service_path = Path(service_path)
         self.service_name = self.service_path.name
+        self.use_cache = use_cache
         self.errors: List[str] = []
         self.warnings: List[str] = []
         self.info: List[str] = []
 
+        # Per-service file classification, computed once in classify_files()
+        self.ts_files: List[Path] = []
+        self.source_files: List[Path] = []
+        self.test_files: List[Path] = []
+        self.file_contents: Dict[Path, Optional[str]] = {}
+
         # Memori integration with Self-Improving Intelligence
         self.memori = None
         self.context = None
@@ -66,13 +144,16 @@ class ServiceValidator:
         if self.context:
             self.query_past_violations()
 
-        # Run all checks
-        self.check_required_files()
-        self.check_no_class_services()
-        self.check_no_returntype_inference()
-        self.check_supabase_typing()
-        self.check_readme_content()
-        self.detect_pattern()
+        # Run all checks, unless no file changed since the cached run
+        self.classify_files()
+        fingerprint = self.compute_fingerprint()
+        if not (self.use_cache and self.load_cached_results(fingerprint)):
+            self.check_required_files()
+            self.check_source_anti_patterns()
+            self.check_readme_content()
+            self.detect_pattern()
+            if self.use_cache:
+                self.save_cached_results(fingerprint)
 
         # Record findings to Memori
         if self.context:
@@ -132,18 +213,17 @@ class ServiceValidator:
             print(f"{BLUE}📚 Historical Context:{RESET}")
             print(f"   Found {len(past_violations)} past validation issues for {self.service_name}\n")
 
-            # Group by pattern
-            patterns = {}
+            # Tally [occurrences, resolved] per pattern in a single pass
+            patterns: Dict[str, List[int]] = {}
             for v in past_violations:
                 metadata = v.get("metadata", {})
-                pattern = metadata.get("pattern_violated", "Unknown")
-                if pattern not in patterns:
-                    patterns[pattern] = []
-                patterns[pattern].append(v)
+                tally = patterns.setdefault(metadata.get("pattern_violated", "Unknown"), [0, 0])
+                tally[0] += 1
+                if metadata.get("resolved"):
+                    tally[1] += 1
 
-            for pattern, issues in list(patterns.items())[:3]:  # Show top 3
-                resolved_count = sum(1 for i in issues if i.get("metadata", {}).get("resolved"))
-                print(f"   - {pattern}: {len(issues)} occurrences ({resolved_count} resolved)")
+            for pattern, (occurrences, resolved_count) in list(patterns.items())[:3]:  # Show top 3
+                print(f"   - {pattern}: {occurrences} occurrences ({resolved_count} resolved)")
 
             print()
 
@@ -199,7 +279,7 @@ class ServiceValidator:
         """Extract anti-pattern name from error/warning message."""
         if "ANTI-PATTERN" in message:
             # Extract pattern name from "ANTI-PATTERN: Pattern name detected"
-            match = re.search(r'ANTI-PATTERN:\s*([^.]+?)(?:\sdetected|\.|$)', message)
+            match = ANTI_PATTERN_NAME.search(message)
             if match:
                 return match.group(1).strip()
 
@@ -219,7 +299,7 @@ class ServiceValidator:
     def extract_file_location(self, message: str) -> Optional[str]:
         """Extract file location from error/warning message."""
         # Look for pattern: "filename.ts:"
-        match = re.search(r'(\w+\.ts)(?::\d+)?', message)
+        match = FILE_LOCATION.search(message)
         if match:
             return match.group(1)
         return None
@@ -235,72 +315,91 @@ class ServiceValidator:
             else:
                 self.info.append(f"✓ Found {filename}")
 
-    def check_no_class_services(self):
-        """Ensure no class-based service definitions."""
-        pattern = re.compile(r'export\s+class\s+\w+Service')
+    def classify_files(self):
+        """Glob the service's .ts files once and split source from tests."""
+        self.ts_files = sorted(self.service_path.glob('*.ts'))
+        self.source_files = [f for f in self.ts_files if not f.name.endswith('.test.ts')]
+        self.test_files = [f for f in self.ts_files if f.name.endswith('.test.ts')]
 
-        for ts_file in self.service_path.glob('*.ts'):
-            if ts_file.name.endswith('.test.ts'):
+    def compute_fingerprint(self) -> Dict[str, List[int]]:
+        """(mtime_ns, size) of every file the checks read, plus this script."""
+        fingerprint = {}
+        for path in [Path(__file__), self.service_path / 'README.md', *self.ts_files]:
+            try:
+                st = path.stat()
+            except FileNotFoundError:
                 continue
+            fingerprint[path.name] = [st.st_mtime_ns, st.st_size]
+        return fingerprint
+
+    def load_cached_results(self, fingerprint: Dict[str, List[int]]) -> bool:
+        """Restore errors/warnings/info from the cache if the fingerprint matches."""
+        entry = load_validation_cache().get(str(self.service_path.resolve()))
+        if not entry or entry.get('fingerprint') != fingerprint:
+            return False
+
+        self.errors = entry['errors']
+        self.warnings = entry['warnings']
+        self.info = entry['info']
+        print(f"{BLUE}♻️  No changes since last run - using cached results (--no-cache to force){RESET}\n")
+        return True
+
+    def save_cached_results(self, fingerprint: Dict[str, List[int]]):
+        """Persist this run's results under the service's fingerprint."""
+        cache = load_validation_cache()
+        cache[str(self.service_path.resolve())] = {
+            'fingerprint': fingerprint,
+            'errors': self.errors,
+            'warnings': self.warnings,
+            'info': self.info,
+        }
+        save_validation_cache(cache)
 
-            content = ts_file.read_text()
-            if pattern.search(content):
-                self.errors.append(
-                    f"{ts_file.name}: ANTI-PATTERN: Class-based service detected. "
-                    "Use functional factories instead."
-                )
-
-    def check_no_returntype_inference(self):
-        """Detect ReturnType inference anti-pattern."""
-        pattern = re.compile(r'ReturnType<typeof\s+create\w+Service>')
-
-        for ts_file in self.service_path.glob('*.ts'):
-            content = ts_file.read_text()
-            if pattern.search(content):
-                self.errors.append(
-                    f"{ts_file.name}: ANTI-PATTERN: ReturnType inference detected. "
-                    "Use explicit interface instead."
-                )
-
-    def check_supabase_typing(self):
-        """Verify proper SupabaseClient typing."""
-        any_pattern = re.compile(r'supabase:\s*any')
-        correct_pattern = re.compile(r'SupabaseClient<Database>')
-
-        for ts_file in self.service_path.glob('*.ts'):
-            if ts_file.name.endswith('.test.ts'):
+    def read_file(self, file_path: Path) -> Optional[str]:
+        """Read a service file once and reuse the decoded content across checks."""
+        if file_path not in self.file_contents:
+            try:
+                self.file_contents[file_path] = file_path.read_bytes().decode('utf-8', 'replace')
+            except FileNotFoundError:
+                self.file_contents[file_path] = None
+        return self.file_contents[file_path]
+
+    def check_source_anti_patterns(self):
+        """
+        Detect class-based services, ReturnType inference and 'supabase: any'.
+
+        Each file is scanned once with ANTI_PATTERN_SCAN instead of once per rule.
+        """
+        for ts_file in self.ts_files:
+            is_test = ts_file.name.endswith('.test.ts')
+            content = self.read_file(ts_file) or ''
+            if not any(keyword in content for keyword in ANTI_PATTERN_KEYWORDS):
                 continue
 
-            content = ts_file.read_text()
+            # First match offset per rule
+            fired: Dict[str, int] = {}
+            for m in ANTI_PATTERN_SCAN.finditer(content):
+                fired.setdefault(m.lastgroup, m.start())
 
-            # Check for 'supabase: any'
-            if any_pattern.search(content):
-                self.errors.append(
-                    f"{ts_file.name}: Type safety violation: 'supabase: any' detected. "
-                    "Use 'supabase: SupabaseClient<Database>' instead."
-                )
+            line_starts = compute_line_starts(content) if fired else []
+            for name, _, message, applies_to_tests in ANTI_PATTERN_RULES:
+                if name in fired and (applies_to_tests or not is_test):
+                    line_no = bisect.bisect_right(line_starts, fired[name])
+                    self.errors.append(f"{ts_file.name}:{line_no}: {message}")
 
             # If file has supabase parameter, verify correct typing
-            if 'supabase' in content and correct_pattern.search(content):
+            if not is_test and 'supabase' in content and 'SupabaseClient<Database>' in content:
                 self.info.append(f"✓ {ts_file.name}: Proper SupabaseClient typing")
 
     def check_readme_content(self):
         """Validate README.md has required sections."""
-        readme_path = self.service_path / 'README.md'
-        if not readme_path.exists():
+        content = self.read_file(self.service_path / 'README.md')
+        if content is None:
             return
 
-        content = readme_path.read_text()
-
-        required_sections = {
-            'Bounded Context': r'>\s*\*\*Bounded Context\*\*:',
-            'SRM Reference': r'>\s*\*\*SRM Reference\*\*:',
-            'Pattern': r'##\s*Pattern',
-            'Ownership': r'##\s*Ownership',
-        }
-
-        for section_name, pattern_str in required_sections.items():
-            if not re.search(pattern_str, content):
+        for section_name, pattern in README_SECTION_PATTERNS.items():
+            # Every section pattern contains its name literally; skip the regex when absent
+            if section_name not in content or not pattern.search(content):
                 self.warnings.append(
                     f"README.md: Missing or malformed section: {section_name}"
                 )
@@ -309,11 +408,8 @@ class ServiceValidator:
 
     def detect_pattern(self):
         """Detect service pattern (A, B, or C)."""
-        has_business_logic = any(
-            f.suffix == '.ts' and not f.name.startswith('keys') and not f.name.endswith('.test.ts')
-            for f in self.service_path.glob('*.ts')
-        )
-        has_tests = any(f.name.endswith('.test.ts') for f in self.service_path.glob('*.ts'))
+        has_business_logic = any(not f.name.startswith('keys') for f in self.source_files)
+        has_tests = bool(self.test_files)
 
         if has_business_logic and has_tests:
             pattern = "A (Contract-First)"
@@ -386,18 +482,21 @@ class ServiceValidator:
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python validate_service_structure.py <service-path>")
+    args = [arg for arg in sys.argv[1:] if arg != '--no-cache']
+    use_cache = '--no-cache' not in sys.argv[1:]
+
+    if not args:
+        print("Usage: python validate_service_structure.py <service-path> [--no-cache]")
         print("Example: python validate_service_structure.py services/loyalty")
         sys.exit(1)
 
-    service_path = sys.argv[1]
+    service_path = args[0]
 
     if not os.path.exists(service_path):
         print(f"{RED}Error:{RESET} Service path does not exist: {service_path}")
         sys.exit(1)
 
-    validator = ServiceValidator(service_path)
+    validator = ServiceValidator(service_path, use_cache=use_cache)
     success = validator.validate()
 
     sys.exit(0 if success else 1)
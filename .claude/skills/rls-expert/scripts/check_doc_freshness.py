@@ -15,28 +15,96 @@ Exit codes:
 
 import hashlib
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 SCRIPT_DIR = Path(__file__).parent
 SKILL_DIR = SCRIPT_DIR.parent
 PROJECT_ROOT = SKILL_DIR.parent.parent.parent
 MANIFEST_PATH = SKILL_DIR / 'generated' / 'freshness-manifest.json'
+HASH_CACHE_PATH = SKILL_DIR / 'generated' / '.hash-cache.json'
+HASH_CHUNK_SIZE = 1 << 20  # 1 MiB reads for the pre-3.11 fallback
+MAX_HASH_WORKERS = 8
 
 
 def sha256_file(filepath: Path) -> str:
     """Compute SHA256 hash of a file."""
     if not filepath.exists():
         return "FILE_NOT_FOUND"
-    sha256_hash = hashlib.sha256()
     with open(filepath, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
+        if sys.version_info >= (3, 11):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        sha256_hash = hashlib.sha256()
+        for byte_block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
             sha256_hash.update(byte_block)
     return sha256_hash.hexdigest()
 
 
+def read_json(path: Path) -> Dict:
+    """Parse a JSON file, using orjson when it is installed."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def load_hash_cache() -> Dict:
+    """Load cached hashes keyed by document path, or an empty cache."""
+    try:
+        return read_json(HASH_CACHE_PATH)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_hash_cache(cache: Dict) -> None:
+    """Write the hash cache atomically (temp file + rename)."""
+    tmp_path = HASH_CACHE_PATH.with_suffix('.tmp')
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, HASH_CACHE_PATH)
+    except OSError as e:
+        print(f"WARNING: Could not write hash cache: {e}")
+
+
+def cached_sha256_file(filepath: Path, cache: Dict) -> str:
+    """Return the file's SHA256, reusing the cached value while (mtime, size) match."""
+    try:
+        st = filepath.stat()
+    except FileNotFoundError:
+        return "FILE_NOT_FOUND"
+
+    key = str(filepath)
+    entry = cache.get(key)
+    if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+        return entry['sha256']
+
+    digest = sha256_file(filepath)
+    cache[key] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'sha256': digest}
+    return digest
+
+
+def hash_documents(source_documents: Dict, cache: Dict) -> Dict[str, str]:
+    """Hash all source documents concurrently (hashlib releases the GIL)."""
+    items = list(source_documents.items())
+    if not items:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(MAX_HASH_WORKERS, len(items))) as executor:
+        hashes = executor.map(
+            lambda item: cached_sha256_file(PROJECT_ROOT / item[1]['path'], cache), items
+        )
+        return dict(zip((doc_key for doc_key, _ in items), hashes))
+
+
 def load_manifest() -> Dict:
     """Load the freshness manifest."""
     if not MANIFEST_PATH.exists():
@@ -44,20 +112,19 @@ def load_manifest() -> Dict:
         print(f"  Expected at: {MANIFEST_PATH}")
         sys.exit(1)
 
-    with open(MANIFEST_PATH, 'r') as f:
-        return json.load(f)
+    return read_json(MANIFEST_PATH)
 
 
-def check_document(doc_key: str, doc_info: Dict, stale_threshold: int) -> Tuple[str, List[str]]:
+def check_document(
+    doc_key: str, doc_info: Dict, actual_hash: str, stale_threshold: int
+) -> Tuple[str, List[str]]:
     """
     Check a single document for freshness.
 
     Returns:
         Tuple of (status, messages) where status is 'ok', 'warning', or 'error'
     """
-    doc_path = PROJECT_ROOT / doc_info['path']
     expected_hash = doc_info['sha256']
-    actual_hash = sha256_file(doc_path)
     messages = []
 
     if actual_hash == "FILE_NOT_FOUND":
@@ -171,9 +238,14 @@ def main() -> int:
         'security_policies': []
     }
 
-    for doc_key, doc_info in manifest.get('source_documents', {}).items():
+    source_documents = manifest.get('source_documents', {})
+    hash_cache = load_hash_cache()
+    hashes = hash_documents(source_documents, hash_cache)
+    save_hash_cache(hash_cache)
+
+    for doc_key, doc_info in source_documents.items():
         category = doc_info.get('category', 'strategy')
-        status, messages = check_document(doc_key, doc_info, stale_threshold)
+        status, messages = check_document(doc_key, doc_info, hashes[doc_key], stale_threshold)
         results[category].append((doc_key, status, messages))
 
     return print_report(results)
@@ -12,34 +12,57 @@ Usage:
 import hashlib
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Dict
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 SCRIPT_DIR = Path(__file__).parent
 SKILL_DIR = SCRIPT_DIR.parent
 PROJECT_ROOT = SKILL_DIR.parent.parent.parent
 MANIFEST_PATH = SKILL_DIR / 'generated' / 'freshness-manifest.json'
+HASH_CHUNK_SIZE = 1 << 20  # 1 MiB reads for the pre-3.11 fallback
+MAX_HASH_WORKERS = 8
 
 
 def sha256_file(filepath: Path) -> str:
     """Compute SHA256 hash of a file."""
     if not filepath.exists():
         return "FILE_NOT_FOUND"
-    sha256_hash = hashlib.sha256()
     with open(filepath, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
+        if sys.version_info >= (3, 11):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        sha256_hash = hashlib.sha256()
+        for byte_block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
             sha256_hash.update(byte_block)
     return sha256_hash.hexdigest()
 
 
+def hash_documents(source_documents: Dict) -> Dict[str, str]:
+    """Hash all source documents concurrently (hashlib releases the GIL)."""
+    items = list(source_documents.items())
+    if not items:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(MAX_HASH_WORKERS, len(items))) as executor:
+        hashes = executor.map(lambda item: sha256_file(PROJECT_ROOT / item[1]['path']), items)
+        return dict(zip((doc_key for doc_key, _ in items), hashes))
+
+
 def regenerate_manifest() -> int:
     """Regenerate manifest with current hashes."""
     if not MANIFEST_PATH.exists():
         print("ERROR: Manifest not found. Cannot regenerate.")
         return 1
 
-    with open(MANIFEST_PATH, 'r') as f:
-        manifest = json.load(f)
+    with open(MANIFEST_PATH, 'rb') as f:
+        data = f.read()
+    manifest = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
 
     today = datetime.now().strftime('%Y-%m-%d')
     updated_count = 0
@@ -49,10 +72,12 @@ def regenerate_manifest() -> int:
     print("=" * 60)
     print()
 
-    for doc_key, doc_info in manifest.get('source_documents', {}).items():
-        doc_path = PROJECT_ROOT / doc_info['path']
+    source_documents = manifest.get('source_documents', {})
+    hashes = hash_documents(source_documents)
+
+    for doc_key, doc_info in source_documents.items():
         old_hash = doc_info['sha256']
-        new_hash = sha256_file(doc_path)
+        new_hash = hashes[doc_key]
 
         if new_hash == "FILE_NOT_FOUND":
             print(f"  SKIP: {doc_key} (file not found)")
@@ -72,8 +97,14 @@ def regenerate_manifest() -> int:
 
     manifest['generated_at'] = today
 
-    with open(MANIFEST_PATH, 'w') as f:
-        json.dump(manifest, f, indent=2)
+    # Both writers emit identical bytes (UTF-8, no \u escapes), so the
+    # committed manifest does not churn with whether orjson is installed
+    if ORJSON_AVAILABLE:
+        with open(MANIFEST_PATH, 'wb') as f:
+            f.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+    else:
+        with open(MANIFEST_PATH, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
 
     print()
     print("=" * 60)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Shared plumbing for the documentation ingestion scripts.
+
+memori-ingest.py (whole-file memories), memori-ingest-simple.py (whole-file
+memories via COPY) and memori-ingest-v2.py (per-section facts) all import
+their project paths, config, database pool, file discovery and JSON helpers
+from here, so connection settings and tuning live in one place.
+"""
+
+import json
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Optional
+
+import yaml
+from psycopg2.pool import ThreadedConnectionPool
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Project root
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# Database config
+DB_CONFIG = {
+    "host": "127.0.0.1",
+    "port": 54322,
+    "database": "postgres",
+    "user": "postgres",
+    "password": "postgres",
+    # Ingestion is idempotent and restartable from the source .md files, so
+    # losing the last few commits on a server crash is acceptable: skip the
+    # per-commit WAL fsync, and give sorts/index maintenance more memory.
+    "options": "-c synchronous_commit=off -c work_mem=64MB -c maintenance_work_mem=256MB",
+}
+_pool = None
+
+# Load Memori config
+config_path = project_root / ".memori" / "config.yml"
+with open(config_path, 'r') as f:
+    config = yaml.safe_load(f)
+
+
+def get_pool() -> ThreadedConnectionPool:
+    """Return the process-wide connection pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        _pool = ThreadedConnectionPool(2, 8, **DB_CONFIG)
+    return _pool
+
+
+def close_pool():
+    """Close every pooled connection, if the pool was ever created."""
+    if _pool is not None and not _pool.closed:
+        _pool.closeall()
+
+
+@contextmanager
+def pooled_connection():
+    """Borrow a connection from the pool and return it when done."""
+    pool = get_pool()
+    conn = pool.getconn()
+    conn.autocommit = False
+    try:
+        yield conn
+    finally:
+        pool.putconn(conn)
+
+
+def expand_glob_patterns(patterns: List[str], suffix: Optional[str] = None) -> List[Path]:
+    """
+    Expand glob patterns to file paths, deduplicating overlapping matches.
+
+    With suffix set, paths are filtered on it before the is_file() stat, so
+    only candidate files pay for a syscall.
+    """
+    seen = {}
+    for pattern in patterns:
+        for path in project_root.glob(pattern):
+            if suffix is None or path.suffix == suffix:
+                seen.setdefault(path, None)
+    # Stat each distinct path once, keeping first-match order
+    return [path for path in seen if path.is_file()]
+
+
+def json_dumps(obj) -> str:
+    """Serialize to a JSON str, using orjson when it is installed."""
+    return orjson.dumps(obj).decode() if ORJSON_AVAILABLE else json.dumps(obj)
+
+
+def json_loads(data):
+    """Parse JSON from str or bytes, using orjson when it is installed."""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
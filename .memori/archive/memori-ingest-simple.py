@@ -5,41 +5,49 @@ Simple documentation ingestion into Memori database.
 This bypasses Memori SDK's LLM agents and directly inserts into the database.
 """
 
-import os
-import sys
-from pathlib import Path
-import yaml
-import glob as glob_module
+import csv
+import io
+import re
+from concurrent.futures import ProcessPoolExecutor
 import psycopg2
-import json
 from loguru import logger
 
-# Project root
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-# Database config
-DB_CONFIG = {
-    "host": "127.0.0.1",
-    "port": 54322,
-    "database": "postgres",
-    "user": "postgres",
-    "password": "postgres"
+from ingest_common import DB_CONFIG, config, expand_glob_patterns, json_dumps, project_root
+
+# Upper bound on contexts ingested concurrently (one process + connection each)
+MAX_INGEST_WORKERS = 8
+
+# Emit a progress line every N files; per-file status is logged at TRACE
+PROGRESS_INTERVAL = 100
+
+# Path-based category classifier. Branches are anchored lookaheads so the
+# first matching branch wins, preserving the original if/elif priority
+# (e.g. an anti-pattern doc under adr/ is still "rules").
+CATEGORY_PATTERN = re.compile(
+    r'^(?:(?=.*anti-pattern)(?P<rules>)'
+    r'|(?=.*(?:adr|decision))(?P<facts_adr>)'
+    r'|(?=.*memory)(?P<context>)'
+    r'|(?=.*(?:prd|spec))(?P<facts_prd>))',
+    re.DOTALL,
+)
+CATEGORY_BY_GROUP = {
+    "rules": "rules",
+    "facts_adr": "facts",
+    "context": "context",
+    "facts_prd": "facts",
 }
 
-# Load Memori config
-config_path = project_root / ".memori" / "config.yml"
-with open(config_path, 'r') as f:
-    config = yaml.safe_load(f)
 
-
-def expand_glob_patterns(patterns):
-    """Expand glob patterns to file paths."""
-    files = []
-    for pattern in patterns:
-        matches = glob_module.glob(str(project_root / pattern), recursive=True)
-        files.extend([Path(p) for p in matches if Path(p).is_file()])
-    return files
+def copy_memories(cur, rows):
+    """Bulk-load memory rows with COPY FROM STDIN (CSV quoting handles newlines)."""
+    buf = io.StringIO()
+    csv.writer(buf, quoting=csv.QUOTE_MINIMAL, lineterminator='\n').writerows(rows)
+    buf.seek(0)
+    cur.copy_expert(
+        "COPY memori.memories (user_id, content, category, metadata) "
+        "FROM STDIN WITH (FORMAT csv)",
+        buf,
+    )
 
 
 def ingest_context(context_name, context_config, conn):
@@ -54,73 +62,77 @@ def ingest_context(context_name, context_config, conn):
 
     logger.info(f"  Found {len(files)} files")
 
-    cur = conn.cursor()
-    ingested = 0
+    rows = []
+    # Fields shared by every file in this context, built once
+    base_metadata = {"type": "documentation", "context": context_name}
 
-    for file_path in files:
+    for index, file_path in enumerate(files, 1):
+        if index % PROGRESS_INTERVAL == 0:
+            logger.info(f"  Progress: {index}/{len(files)}")
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            size = file_path.stat().st_size
+            if size == 0:
+                continue
 
+            # Determine category (path-only, independent of content)
+            match = CATEGORY_PATTERN.match(str(file_path).lower())
+            category = CATEGORY_BY_GROUP[match.lastgroup] if match else "context"
+
+            content = file_path.read_text(encoding='utf-8', errors='replace')
             if not content.strip():
                 continue
 
-            # Determine category
-            category = "context"
-            fp_str = str(file_path).lower()
-            if "anti-pattern" in fp_str:
-                category = "rules"
-            elif "adr" in fp_str or "decision" in fp_str:
-                category = "facts"
-            elif "memory" in fp_str:
-                category = "context"
-            elif "prd" in fp_str or "spec" in fp_str:
-                category = "facts"
-
             metadata = {
                 "file": str(file_path.relative_to(project_root)),
-                "type": "documentation",
-                "context": context_name,
+                **base_metadata,
                 "category": category
             }
 
-            # Insert
-            cur.execute("""
-                INSERT INTO memori.memories (user_id, content, category, metadata)
-                VALUES (%s, %s, %s, %s)
-            """, (user_id, content, category, json.dumps(metadata)))
-
-            ingested += 1
-            logger.info(f"    ✓ {file_path.name} ({len(content)} chars)")
+            rows.append((user_id, content, category, json_dumps(metadata)))
+            logger.trace(f"    ✓ {file_path.name} ({len(content)} chars)")
 
         except Exception as e:
             logger.error(f"    ✗ {file_path.name}: {e}")
 
+    # Single COPY instead of one INSERT round-trip per file
+    cur = conn.cursor()
+    copy_memories(cur, rows)
     conn.commit()
     cur.close()
 
+    ingested = len(rows)
+
     logger.success(f"  ✅ Ingested {ingested} files for {context_name}")
     return ingested
 
 
+def ingest_context_entry(context):
+    """Worker entry point: ingest one context over its own connection."""
+    # Connections are not fork-safe to share, so each worker opens its own
+    conn = psycopg2.connect(**DB_CONFIG)
+    try:
+        return ingest_context(context['name'], context, conn)
+    finally:
+        conn.close()
+
+
 def main():
     logger.info("=" * 60)
     logger.info("PT-2 Documentation Ingestion (Simple)")
     logger.info("=" * 60)
 
-    conn = psycopg2.connect(**DB_CONFIG)
+    contexts = config.get('contexts', [])
+    logger.info(f"Processing {len(contexts)} contexts\n")
 
-    try:
-        contexts = config.get('contexts', [])
-        logger.info(f"Processing {len(contexts)} contexts\n")
-
-        total_ingested = 0
+    total_ingested = 0
+    if contexts:
+        with ProcessPoolExecutor(max_workers=min(MAX_INGEST_WORKERS, len(contexts))) as executor:
+            total_ingested = sum(executor.map(ingest_context_entry, contexts))
+        logger.info("")
 
-        for context in contexts:
-            count = ingest_context(context['name'], context, conn)
-            total_ingested += count
-            logger.info("")
+    conn = psycopg2.connect(**DB_CONFIG)
 
+    try:
         # Summary
         logger.info("=" * 60)
         logger.info("Ingestion Summary")
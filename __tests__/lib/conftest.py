@@ -11,6 +11,8 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
 
@@ -18,3 +20,27 @@ import pytest
 def project_root_path():
     """Return the project root path."""
     return project_root
+
+
+@pytest.fixture
+def mock_pool():
+    """Create a mock asyncpg pool with proper async context managers.
+
+    Shared by the lib/context and lib/memori service tests; returns (pool, conn).
+    """
+    pool = MagicMock()
+    conn = AsyncMock()
+
+    # Create async context manager mock for pool.acquire()
+    acquire_cm = AsyncMock()
+    acquire_cm.__aenter__.return_value = conn
+    acquire_cm.__aexit__.return_value = None
+    pool.acquire.return_value = acquire_cm
+
+    # Create async context manager mock for conn.transaction()
+    tx_cm = AsyncMock()
+    tx_cm.__aenter__.return_value = None
+    tx_cm.__aexit__.return_value = None
+    conn.transaction.return_value = tx_cm
+
+    return pool, conn
@@ -4,7 +4,10 @@ Tests for SessionCompactor and compaction strategies.
 Tests sliding window, token truncation, and recursive summarization.
 """
 
+import math
+
 import pytest
+from dataclasses import replace
 from datetime import datetime
 
 from lib.context.models import SessionEvent, EventType
@@ -15,6 +18,22 @@ from lib.context.compaction import (
     TokenTruncationStrategy,
     RecursiveSummarizationStrategy,
     SimpleSummarizer,
+    CachingSummarizer,
+    event_type_entropy,
+    truncation_cutoff,
+)
+
+
+# Shared template; tests only vary id, sequence, type, role and content
+_TEMPLATE_EVENT = SessionEvent(
+    id="",
+    session_id="test-session",
+    sequence=0,
+    type="user_message",
+    role="user",
+    content="",
+    created_at=datetime.now(),
+    parts=None,
 )
 
 
@@ -24,15 +43,13 @@ def create_test_event(
     content: str = "Test message",
 ) -> SessionEvent:
     """Helper to create test events."""
-    return SessionEvent(
+    return replace(
+        _TEMPLATE_EVENT,
         id=f"event-{sequence}",
-        session_id="test-session",
         sequence=sequence,
         type=event_type,
         role="user" if event_type == "user_message" else "assistant",
         content=content,
-        created_at=datetime.now(),
-        parts=None,
     )
 
 
@@ -92,6 +109,20 @@ class TestSlidingWindowStrategy:
         assert result.compacted_count == 0
         assert result.original_count == 0
 
+    @pytest.mark.asyncio
+    async def test_keeps_leading_events_at_turn_limit(self):
+        """Test events before the first turn are kept when turns equal max_turns."""
+        strategy = SlidingWindowStrategy()
+        config = CompactionConfig(max_turns=2)
+
+        events = [create_test_event(0, "system_event", "Session started")]
+        events.extend(create_turn(1))
+        events.extend(create_turn(2))
+
+        result = await strategy.compact(events, config)
+
+        assert result.events == events
+
 
 class TestTokenTruncationStrategy:
     """Tests for TokenTruncationStrategy."""
@@ -134,6 +165,12 @@ class TestTokenTruncationStrategy:
             assert kept_sequences == sorted(kept_sequences)
             assert max(kept_sequences) == 4  # Last event should be included
 
+    def test_truncation_cutoff(self):
+        """Test the cutoff stops at the first newest-first total over budget."""
+        assert truncation_cutoff([30, 30, 30, 0, 5], 90) == (4, 90)
+        assert truncation_cutoff([30, 30, 30], 29) == (0, 0)
+        assert truncation_cutoff([], 10) == (0, 0)
+
 
 class TestRecursiveSummarizationStrategy:
     """Tests for RecursiveSummarizationStrategy."""
@@ -204,6 +241,48 @@ class TestSessionCompactor:
 
         assert result.strategy_used == "sliding_window"
 
+    @pytest.mark.asyncio
+    async def test_adaptive_budget_tightens_with_entropy(self):
+        """Test adaptive mode shrinks the budget by lambda_factor * entropy."""
+        events = []
+        for i in range(5):
+            events.extend(create_turn(i, "U" * 70, "A" * 70))  # 700 tokens total
+
+        fixed = CompactionConfig(token_budget=1000, chars_per_token=1, min_token_budget=0)
+        adaptive = replace(fixed, adaptive=True, lambda_factor=500)
+
+        # 700 < 0.8 * 1000, but the budget drops to 1000 - 500 * ln(2) ~ 653
+        assert (await SessionCompactor(fixed).compact_if_needed(events)).strategy_used == "none"
+        result = await SessionCompactor(adaptive).compact_if_needed(events)
+        assert result.strategy_used.startswith("recursive_summarization")
+
+    @pytest.mark.asyncio
+    async def test_adaptive_budget_never_exceeds_configured_budget(self):
+        """Test the default floor cannot lift the budget above token_budget."""
+        events = []
+        for i in range(5):
+            events.extend(create_turn(i, "U" * 400, "A" * 400))  # 4000 tokens total
+
+        fixed = CompactionConfig(token_budget=1000, chars_per_token=1)
+        adaptive = replace(fixed, adaptive=True)  # default min_token_budget=10_000
+
+        assert SessionCompactor(adaptive)._effective_config([]).token_budget == 1000
+        assert SessionCompactor(adaptive)._effective_config(events).token_budget == 1000
+
+        fixed_result = await SessionCompactor(fixed).compact_if_needed(events)
+        adaptive_result = await SessionCompactor(adaptive).compact_if_needed(events)
+        assert fixed_result.strategy_used != "none"
+        assert adaptive_result.strategy_used == fixed_result.strategy_used
+        assert adaptive_result.compacted_count <= fixed_result.compacted_count
+
+    def test_event_type_entropy(self):
+        """Test entropy of the event type mix."""
+        turns = create_turn(0) + create_turn(1)
+
+        assert event_type_entropy([]) == 0.0
+        assert event_type_entropy(turns[::2]) == 0.0
+        assert event_type_entropy(turns) == pytest.approx(math.log(2))
+
     def test_count_tokens(self):
         """Test token counting."""
         compactor = SessionCompactor(CompactionConfig(chars_per_token=4))
@@ -262,3 +341,28 @@ class TestSimpleSummarizer:
         summary = await summarizer.summarize([])
 
         assert "No events" in summary
+
+
+class TestCachingSummarizer:
+    """Tests for CachingSummarizer."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_summary_for_same_events(self):
+        """Test repeated windows are summarized once and new content misses the cache."""
+        calls = []
+
+        class CountingSummarizer:
+            async def summarize(self, events):
+                calls.append(len(events))
+                return f"summary of {len(events)}"
+
+        summarizer = CachingSummarizer(CountingSummarizer(), max_entries=2)
+        events = [create_test_event(i, "user_message", f"Message {i}") for i in range(3)]
+
+        first = await summarizer.summarize(events)
+        second = await summarizer.summarize(list(events))
+        changed = await summarizer.summarize(events[:2] + [create_test_event(2, "user_message", "Edited")])
+
+        assert first == second == "summary of 3"
+        assert changed == "summary of 3"
+        assert calls == [3, 3]
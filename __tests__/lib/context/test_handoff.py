@@ -6,7 +6,6 @@ Tests handoff creation, storage, consumption, and workflow transitions.
 
 import pytest
 from datetime import datetime
-from unittest.mock import AsyncMock
 
 from lib.context.handoff import (
     AgentHandoff,
@@ -138,20 +137,6 @@ class TestAgentHandoff:
 class TestHandoffService:
     """Tests for HandoffService."""
 
-    @pytest.fixture
-    def mock_pool(self):
-        """Create a mock asyncpg pool with proper async context manager."""
-        from unittest.mock import MagicMock
-        pool = MagicMock()
-        conn = AsyncMock()
-
-        cm = AsyncMock()
-        cm.__aenter__.return_value = conn
-        cm.__aexit__.return_value = None
-
-        pool.acquire.return_value = cm
-        return pool, conn
-
     @pytest.mark.asyncio
     async def test_create_handoff(self, mock_pool):
         """Test creating a handoff."""
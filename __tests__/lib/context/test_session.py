@@ -6,33 +6,12 @@ Tests session lifecycle, event logging, and state management.
 
 import pytest
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 
 from lib.context.models import Session, SessionEvent, SessionState, EventType, Role
 from lib.context.session import SessionService
 
 
-@pytest.fixture
-def mock_pool():
-    """Create a mock asyncpg pool with proper async context manager."""
-    pool = MagicMock()
-    conn = AsyncMock()
-
-    # Create async context manager mock for pool.acquire()
-    acquire_cm = AsyncMock()
-    acquire_cm.__aenter__.return_value = conn
-    acquire_cm.__aexit__.return_value = None
-    pool.acquire.return_value = acquire_cm
-
-    # Create async context manager mock for conn.transaction()
-    tx_cm = AsyncMock()
-    tx_cm.__aenter__.return_value = None
-    tx_cm.__aexit__.return_value = None
-    conn.transaction.return_value = tx_cm
-
-    return pool, conn
-
-
 class TestSessionService:
     """Tests for SessionService.
 
@@ -5,8 +5,8 @@ Tests memory extraction, consolidation, and ETL processing.
 """
 
 import pytest
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from unittest.mock import AsyncMock
 
 from lib.memori.pipeline import (
     MemoryGenerationPipeline,
@@ -15,19 +15,17 @@ from lib.memori.pipeline import (
 )
 
 
-@pytest.fixture
-def mock_pool():
-    """Create a mock asyncpg pool with proper async context manager."""
-    from unittest.mock import MagicMock
-    pool = MagicMock()
-    conn = AsyncMock()
-
-    cm = AsyncMock()
-    cm.__aenter__.return_value = conn
-    cm.__aexit__.return_value = None
-
-    pool.acquire.return_value = cm
-    return pool, conn
+@dataclass(slots=True, frozen=True)
+class _TestEvent:
+    """Session event row with attribute access, as the pipeline accepts."""
+    id: str
+    session_id: str
+    sequence: int
+    type: str
+    role: str
+    content: str
+    parts: dict = field(default_factory=dict)
+    created_at: datetime = field(default_factory=datetime.now)
 
 
 def create_test_event(
@@ -35,18 +33,16 @@ def create_test_event(
     event_type: str,
     role: str,
     content: str,
-) -> dict:
-    """Create a test event dict."""
-    return {
-        "id": event_id,
-        "session_id": "test-session",
-        "sequence": 1,
-        "type": event_type,
-        "role": role,
-        "content": content,
-        "parts": {},
-        "created_at": datetime.now(),
-    }
+) -> _TestEvent:
+    """Create a test event."""
+    return _TestEvent(
+        id=event_id,
+        session_id="test-session",
+        sequence=1,
+        type=event_type,
+        role=role,
+        content=content,
+    )
 
 
 class TestMemoryGenerationPipeline:
@@ -112,6 +108,34 @@ class TestMemoryGenerationPipeline:
         assert len(candidates) >= 1
         assert any(c.category == "rules" for c in candidates)
 
+    def test_pattern_extraction_accepts_event_dicts(self):
+        """Test row dicts and attribute events yield the same candidates."""
+        pipeline = MemoryGenerationPipeline(db_url="postgresql://test")
+
+        events = [
+            create_test_event("1", "user_message", "user", "Please remember that the API uses REST"),
+            create_test_event("2", "tool_result", "tool", "Never use global state in services"),
+            create_test_event("3", "model_message", "assistant", "We decided to use PostgreSQL for storage"),
+        ]
+
+        from_objects = pipeline._extract_by_patterns(events)
+        from_dicts = pipeline._extract_by_patterns([asdict(event) for event in events])
+
+        assert from_objects
+        assert from_dicts == from_objects
+
+    def test_pattern_triggers_cover_extraction_patterns(self):
+        """Test every trigger entry belongs to a pattern and is lowercase ASCII."""
+        patterns = {
+            pattern
+            for patterns in MemoryGenerationPipeline.EXTRACTION_PATTERNS.values()
+            for pattern in patterns
+        }
+
+        assert set(MemoryGenerationPipeline.PATTERN_TRIGGERS) <= patterns
+        for triggers in MemoryGenerationPipeline.PATTERN_TRIGGERS.values():
+            assert all(t.isascii() and t == t.lower() for t in triggers)
+
     def test_deduplicate_candidates(self):
         """Test deduplication of similar candidates."""
         pipeline = MemoryGenerationPipeline(db_url="postgresql://test")
@@ -142,6 +166,38 @@ class TestMemoryGenerationPipeline:
         # Should remove near-duplicate
         assert len(deduplicated) == 2
 
+    def test_deduplicate_candidates_keeps_first_of_each_group(self):
+        """Test deduplication across a batch keeps the earliest candidate in order."""
+        pipeline = MemoryGenerationPipeline(db_url="postgresql://test")
+
+        contents = []
+        for i in range(50):
+            contents.append(f"service {i} owns table {i} and writes via rpc number {i}")
+            # Near-duplicate (one extra word) of the candidate just added
+            contents.append(f"service {i} owns the table {i} and writes via rpc number {i}")
+        candidates = [
+            CandidateMemory(content=c, category="facts", source_type="pattern_match", confidence=0.6)
+            for c in contents
+        ]
+
+        deduplicated = pipeline._deduplicate_candidates(candidates)
+
+        assert deduplicated == candidates[::2]
+
+    def test_deduplicate_candidates_collapses_verbatim_repeats(self):
+        """Test repeats differing only in case/whitespace collapse, empty content does not."""
+        pipeline = MemoryGenerationPipeline(db_url="postgresql://test")
+
+        contents = ["Got it, I'll remember that", "got it,  I'll remember that\n", "", ""]
+        candidates = [
+            CandidateMemory(content=c, category="context", source_type="pattern_match", confidence=0.6)
+            for c in contents
+        ]
+
+        deduplicated = pipeline._deduplicate_candidates(candidates)
+
+        assert deduplicated == [candidates[0], candidates[2], candidates[3]]
+
     def test_text_similarity(self):
         """Test text similarity calculation."""
         pipeline = MemoryGenerationPipeline(db_url="postgresql://test")
@@ -160,6 +216,28 @@ class TestMemoryGenerationPipeline:
         )
         assert sim2 < 0.3
 
+    def test_text_similarity_accepts_candidates(self):
+        """Test candidates compare by their cached word sets like raw strings."""
+        pipeline = MemoryGenerationPipeline(db_url="postgresql://test")
+
+        first = CandidateMemory(
+            content="Use PostgreSQL for storage",
+            category="facts",
+            source_type="pattern_match",
+            confidence=0.6,
+        )
+        second = CandidateMemory(
+            content="use postgresql for the  storage",
+            category="facts",
+            source_type="pattern_match",
+            confidence=0.6,
+        )
+
+        expected = pipeline._text_similarity(first.content, second.content)
+
+        assert pipeline._text_similarity(first, second) == expected
+        assert pipeline._text_similarity(first, second.content) == expected
+
     @pytest.mark.skip(reason="Requires asyncpg pool - run as integration test")
     @pytest.mark.asyncio
     async def test_consolidate_creates_new_memory(self, mock_pool):
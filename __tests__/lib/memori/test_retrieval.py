@@ -6,7 +6,6 @@ Tests full-text search, composite scoring, and filtering.
 
 import pytest
 from datetime import datetime
-from unittest.mock import AsyncMock
 
 from lib.memori.retrieval import (
     MemoryRetriever,
@@ -15,21 +14,6 @@ from lib.memori.retrieval import (
 )
 
 
-@pytest.fixture
-def mock_pool():
-    """Create a mock asyncpg pool with proper async context manager."""
-    from unittest.mock import MagicMock
-    pool = MagicMock()
-    conn = AsyncMock()
-
-    cm = AsyncMock()
-    cm.__aenter__.return_value = conn
-    cm.__aexit__.return_value = None
-
-    pool.acquire.return_value = cm
-    return pool, conn
-
-
 def create_mock_memory_row(
     id: int,
     content: str,
@@ -31,6 +31,7 @@ from lib.context.compaction import (
     TokenTruncationStrategy,
     RecursiveSummarizationStrategy,
     SimpleSummarizer,
+    CachingSummarizer,
 )
 from lib.context.hooks import (
     on_session_start,
@@ -74,6 +75,7 @@ __all__ = [
     "TokenTruncationStrategy",
     "RecursiveSummarizationStrategy",
     "SimpleSummarizer",
+    "CachingSummarizer",
     # Hooks
     "on_session_start",
     "on_session_end",
@@ -9,14 +9,57 @@ Implements token budget management through:
 Reference: docs/context-engineering/CONTEXT_MANAGEMENT_EVOLUTION_PROPOSAL.md
 """
 
+import hashlib
+import math
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from bisect import bisect_right
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
+from itertools import accumulate, islice, repeat
+from operator import attrgetter, floordiv
 from typing import Optional, Protocol
 from loguru import logger
 
 from lib.context.models import SessionEvent, EventType
 
+_event_content = attrgetter("content")
+_event_type = attrgetter("type")
+
+
+def content_lengths(events: list[SessionEvent]):
+    """Iterate content lengths of events without a per-event Python frame."""
+    return map(len, map(_event_content, events))
+
+
+def estimate_tokens(events: list[SessionEvent], chars_per_token: int) -> int:
+    """Estimate token count for events from their total content length."""
+    return sum(content_lengths(events)) // chars_per_token
+
+
+def event_type_entropy(events: list[SessionEvent]) -> float:
+    """Shannon entropy (in nats) of the event type distribution."""
+    total = len(events)
+    if not total:
+        return 0.0
+    return -sum(
+        count / total * math.log(count / total)
+        for count in Counter(map(_event_type, events)).values()
+    )
+
+
+def truncation_cutoff(newest_first_tokens, token_budget: int) -> tuple[int, int]:
+    """
+    Count how many of the newest events fit in the token budget.
+
+    Takes per-event token counts ordered newest first and returns
+    (events kept, tokens kept). Running totals are non-decreasing, so the
+    cutoff is a binary search over them; all per-event work stays in C.
+    """
+    running_tokens = list(accumulate(newest_first_tokens))
+    keep = bisect_right(running_tokens, token_budget)
+    return keep, running_tokens[keep - 1] if keep else 0
+
 
 @dataclass
 class CompactionConfig:
@@ -27,6 +70,14 @@ class CompactionConfig:
     keep_recent_turns: int = 10  # Always keep last N turns uncompacted
     summary_target_tokens: int = 500
     checkpoint_on_gates: bool = True
+    # Adaptive budget: B = token_budget - lambda_factor * H, where H is the
+    # entropy of event types over the last adaptive_window events. Varied
+    # recent activity gets a tighter budget; steady threads keep the full one.
+    # The budget is floored at min_token_budget but never exceeds token_budget.
+    adaptive: bool = False
+    lambda_factor: float = 2000
+    adaptive_window: int = 20
+    min_token_budget: int = 10_000
 
 
 @dataclass
@@ -96,11 +147,22 @@ class SlidingWindowStrategy(CompactionStrategy):
         original_count = len(events)
         tokens_before = self._estimate_tokens(events, config)
 
-        # Count turns (user messages)
-        turn_count = sum(1 for e in events if e.type == EventType.USER_MESSAGE.value)
+        # Walk back from the newest event to the max_turns-th user message,
+        # so only the kept window is scanned rather than the whole history
+        user_type = EventType.USER_MESSAGE.value
+        window_start_idx = None
+        turns_seen = 0
+        for offset, event in enumerate(reversed(events)):
+            if event.type == user_type:
+                turns_seen += 1
+                if turns_seen == config.max_turns:
+                    window_start_idx = original_count - 1 - offset
+                    break
 
-        if turn_count <= config.max_turns:
-            # No compaction needed
+        if window_start_idx is None or not any(
+            event.type == user_type for event in islice(events, window_start_idx)
+        ):
+            # No compaction needed: at most max_turns turns in total
             return CompactionResult(
                 events=events,
                 original_count=original_count,
@@ -110,18 +172,6 @@ class SlidingWindowStrategy(CompactionStrategy):
                 strategy_used="sliding_window",
             )
 
-        # Find the start of the window
-        turns_to_skip = turn_count - config.max_turns
-        skipped_turns = 0
-        window_start_idx = 0
-
-        for i, event in enumerate(events):
-            if event.type == EventType.USER_MESSAGE.value:
-                skipped_turns += 1
-                if skipped_turns > turns_to_skip:
-                    window_start_idx = i
-                    break
-
         # Keep events from window start
         compacted_events = events[window_start_idx:]
         tokens_after = self._estimate_tokens(compacted_events, config)
@@ -147,8 +197,7 @@ class SlidingWindowStrategy(CompactionStrategy):
 
     def _estimate_tokens(self, events: list[SessionEvent], config: CompactionConfig) -> int:
         """Estimate token count for events."""
-        total_chars = sum(len(e.content) for e in events)
-        return total_chars // config.chars_per_token
+        return estimate_tokens(events, config.chars_per_token)
 
 
 class TokenTruncationStrategy(CompactionStrategy):
@@ -187,17 +236,10 @@ class TokenTruncationStrategy(CompactionStrategy):
             )
 
         # Keep adding events from the end until budget exceeded
-        compacted_events = []
-        current_tokens = 0
-
-        for event in reversed(events):
-            event_tokens = len(event.content) // config.chars_per_token
-            if current_tokens + event_tokens > config.token_budget:
-                break
-            compacted_events.insert(0, event)
-            current_tokens += event_tokens
+        event_tokens = map(floordiv, content_lengths(reversed(events)), repeat(config.chars_per_token))
+        keep, tokens_after = truncation_cutoff(event_tokens, config.token_budget)
 
-        tokens_after = current_tokens
+        compacted_events = events[original_count - keep:]
 
         # Generate summary of dropped events
         summary = None
@@ -221,8 +263,11 @@ class TokenTruncationStrategy(CompactionStrategy):
 
     def _estimate_tokens(self, events: list[SessionEvent], config: CompactionConfig) -> int:
         """Estimate token count for events."""
-        total_chars = sum(len(e.content) for e in events)
-        return total_chars // config.chars_per_token
+        return estimate_tokens(events, config.chars_per_token)
+
+
+# Strategies hold no state, so the summarizer-less fallback reuses one instance
+_SLIDING_FALLBACK = SlidingWindowStrategy()
 
 
 class RecursiveSummarizationStrategy(CompactionStrategy):
@@ -249,8 +294,7 @@ class RecursiveSummarizationStrategy(CompactionStrategy):
 
         if summarizer is None:
             logger.warning("No summarizer provided, falling back to sliding window")
-            fallback = SlidingWindowStrategy()
-            result = await fallback.compact(events, config, None)
+            result = await _SLIDING_FALLBACK.compact(events, config, None)
             result.strategy_used = "recursive_summarization_fallback"
             return result
 
@@ -336,8 +380,7 @@ class RecursiveSummarizationStrategy(CompactionStrategy):
 
     def _estimate_tokens(self, events: list[SessionEvent], config: CompactionConfig) -> int:
         """Estimate token count for events."""
-        total_chars = sum(len(e.content) for e in events)
-        return total_chars // config.chars_per_token
+        return estimate_tokens(events, config.chars_per_token)
 
 
 class SessionCompactor:
@@ -381,11 +424,13 @@ class SessionCompactor:
                 strategy_used="none",
             )
 
+        config = self._effective_config(events)
+
         # Determine which strategy to use
         if force_strategy:
             strategy_name = force_strategy
         else:
-            strategy_name = self._select_strategy(events)
+            strategy_name = self._select_strategy(events, config)
 
         if strategy_name == "none":
             tokens = self._estimate_tokens(events)
@@ -409,7 +454,7 @@ class SessionCompactor:
             )
 
         logger.info(f"Applying compaction strategy: {strategy_name}")
-        result = await strategy.compact(events, self.config, summarizer)
+        result = await strategy.compact(events, config, summarizer)
 
         if result.reduction_ratio > 0:
             logger.info(
@@ -419,18 +464,39 @@ class SessionCompactor:
 
         return result
 
-    def _select_strategy(self, events: list[SessionEvent]) -> str:
+    def _effective_config(self, events: list[SessionEvent]) -> CompactionConfig:
+        """Return the config with the token budget adjusted when adaptive."""
+        config = self.config
+        if not config.adaptive:
+            return config
+
+        entropy = event_type_entropy(events[-config.adaptive_window:])
+        # Adaptive mode only ever shrinks the budget: the floor is capped
+        # at the configured budget so it can never raise it
+        floor = min(config.min_token_budget, config.token_budget)
+        budget = min(
+            config.token_budget,
+            max(floor, int(config.token_budget - config.lambda_factor * entropy)),
+        )
+        return replace(config, token_budget=budget)
+
+    def _select_strategy(
+        self,
+        events: list[SessionEvent],
+        config: Optional[CompactionConfig] = None,
+    ) -> str:
         """Select appropriate compaction strategy based on thresholds."""
+        config = config or self.config
         turn_count = sum(1 for e in events if e.type == EventType.USER_MESSAGE.value)
         token_estimate = self._estimate_tokens(events)
 
         # Check token budget first (higher priority)
-        if token_estimate > self.config.token_budget * 0.8:
+        if token_estimate > config.token_budget * 0.8:
             # Over 80% of budget - use recursive summarization if available
             return "recursive_summarization"
 
         # Check turn count
-        if turn_count > self.config.max_turns:
+        if turn_count > config.max_turns:
             return "sliding_window"
 
         # No compaction needed
@@ -438,8 +504,7 @@ class SessionCompactor:
 
     def _estimate_tokens(self, events: list[SessionEvent]) -> int:
         """Estimate total tokens in events."""
-        total_chars = sum(len(e.content) for e in events)
-        return total_chars // self.config.chars_per_token
+        return estimate_tokens(events, self.config.chars_per_token)
 
     def count_tokens(self, events: list[SessionEvent]) -> int:
         """Public method to count tokens (alias for estimate)."""
@@ -496,28 +561,67 @@ class SimpleSummarizer:
         if not events:
             return "No events to summarize."
 
-        # Extract key information
-        user_messages = [e for e in events if e.type == EventType.USER_MESSAGE.value]
-        assistant_messages = [e for e in events if e.type == EventType.MODEL_MESSAGE.value]
-        tool_calls = [e for e in events if e.type == EventType.TOOL_CALL.value]
-        gates = [e for e in events if e.type == EventType.VALIDATION_GATE.value]
+        # Extract key information: one tally over event types
+        type_counts = Counter(map(_event_type, events))
+        user_count = type_counts[EventType.USER_MESSAGE.value]
+        gate_count = type_counts[EventType.VALIDATION_GATE.value]
 
         lines = []
         lines.append(f"Summary of {len(events)} events:")
-        lines.append(f"- {len(user_messages)} user messages")
-        lines.append(f"- {len(assistant_messages)} assistant responses")
-        lines.append(f"- {len(tool_calls)} tool calls")
+        lines.append(f"- {user_count} user messages")
+        lines.append(f"- {type_counts[EventType.MODEL_MESSAGE.value]} assistant responses")
+        lines.append(f"- {type_counts[EventType.TOOL_CALL.value]} tool calls")
 
-        if gates:
-            lines.append(f"- {len(gates)} validation gates")
+        if gate_count:
+            lines.append(f"- {gate_count} validation gates")
 
         # Include first and last user messages for context
-        if user_messages:
-            first_msg = user_messages[0].content[:100]
+        if user_count:
+            user_type = EventType.USER_MESSAGE.value
+            first_msg = next(e for e in events if e.type == user_type).content[:100]
             lines.append(f"\nStarted with: {first_msg}...")
 
-            if len(user_messages) > 1:
-                last_msg = user_messages[-1].content[:100]
+            if user_count > 1:
+                last_msg = next(e for e in reversed(events) if e.type == user_type).content[:100]
                 lines.append(f"Ended with: {last_msg}...")
 
         return "\n".join(lines)
+
+
+class CachingSummarizer:
+    """
+    LRU cache in front of another summarizer, keyed by a digest of the events.
+
+    Recursive summarization re-summarizes the same older window as the session
+    rolls forward; with an LLM summarizer each repeat is a full model call.
+    """
+
+    def __init__(self, summarizer: SummarizerProtocol, max_entries: int = 1024):
+        self.summarizer = summarizer
+        self.max_entries = max_entries
+        self._cache: OrderedDict[bytes, str] = OrderedDict()
+
+    @staticmethod
+    def _cache_key(events: list[SessionEvent]) -> bytes:
+        """Digest of each event's id, type and content (length-prefixed, so fields cannot run together)."""
+        digest = hashlib.blake2b(digest_size=16)
+        for event in events:
+            for value in (event.id, event.type, event.content):
+                encoded = value.encode()
+                digest.update(len(encoded).to_bytes(8, "little"))
+                digest.update(encoded)
+        return digest.digest()
+
+    async def summarize(self, events: list[SessionEvent]) -> str:
+        """Return the cached summary for these events, summarizing on a miss."""
+        key = self._cache_key(events)
+        summary = self._cache.get(key)
+        if summary is not None:
+            self._cache.move_to_end(key)
+            return summary
+
+        summary = await self.summarizer.summarize(events)
+        self._cache[key] = summary
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return summary
@@ -9,9 +9,11 @@ Enables structured handoffs between chatmodes in workflows:
 Reference: docs/context-engineering/CONTEXT_MANAGEMENT_EVOLUTION_PROPOSAL.md
 """
 
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 from loguru import logger
 
 try:
@@ -20,8 +22,14 @@ try:
 except ImportError:
     ASYNCPG_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
-@dataclass
+@dataclass(slots=True)
 class HandoffContext:
     """
     Context passed between agents during workflow transitions.
@@ -81,7 +89,7 @@ class HandoffContext:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentHandoff:
     """
     Represents a handoff between two agents (chatmodes).
@@ -133,49 +141,36 @@ class AgentHandoff:
 
     def format_for_prompt(self) -> str:
         """Format handoff as text for injection into target agent's prompt."""
+        context = self.handoff_context
         lines = [
             f"## Handoff from {self.from_chatmode}",
             f"**Workflow**: {self.workflow}",
             "",
         ]
 
-        if self.handoff_context.spec_file:
-            lines.append(f"**Spec File**: {self.handoff_context.spec_file}")
+        if context.spec_file:
+            lines.append(f"**Spec File**: {context.spec_file}")
 
-        if self.handoff_context.validation_gates_passed:
-            gates = ", ".join(str(g) for g in self.handoff_context.validation_gates_passed)
+        if context.validation_gates_passed:
+            gates = ", ".join(map(str, context.validation_gates_passed))
             lines.append(f"**Validation Gates Passed**: {gates}")
 
-        if self.handoff_context.artifacts_created:
-            lines.append("**Artifacts Created**:")
-            for artifact in self.handoff_context.artifacts_created:
-                lines.append(f"  - {artifact}")
-
-        if self.handoff_context.files_modified:
-            lines.append("**Files Modified**:")
-            for file in self.handoff_context.files_modified:
-                lines.append(f"  - {file}")
-
-        if self.handoff_context.key_decisions:
-            lines.append("**Key Decisions**:")
-            for decision in self.handoff_context.key_decisions:
-                lines.append(f"  - {decision}")
-
-        if self.handoff_context.blockers:
-            lines.append("**Blockers**:")
-            for blocker in self.handoff_context.blockers:
-                lines.append(f"  - {blocker}")
-
-        if self.handoff_context.open_questions:
-            lines.append("**Open Questions**:")
-            for question in self.handoff_context.open_questions:
-                lines.append(f"  - {question}")
+        for heading, items in (
+            ("**Artifacts Created**:", context.artifacts_created),
+            ("**Files Modified**:", context.files_modified),
+            ("**Key Decisions**:", context.key_decisions),
+            ("**Blockers**:", context.blockers),
+            ("**Open Questions**:", context.open_questions),
+        ):
+            if items:
+                lines.append(heading)
+                lines.extend(f"  - {item}" for item in items)
 
         if self.session_summary:
             lines.extend(["", "### Session Summary", self.session_summary])
 
-        if self.handoff_context.notes:
-            lines.extend(["", "### Notes", self.handoff_context.notes])
+        if context.notes:
+            lines.extend(["", "### Notes", context.notes])
 
         return "\n".join(lines)
 
@@ -244,8 +239,6 @@ class HandoffService:
         """Store handoff in session state."""
         pool = await self._get_pool()
 
-        import json
-
         async with pool.acquire() as conn:
             await conn.execute(
                 """
@@ -260,7 +253,9 @@ class HandoffService:
                 WHERE session_id = $1
                 """,
                 session_id,
-                json.dumps(handoff.to_dict()),
+                orjson.dumps(handoff.to_dict()).decode()
+                if ORJSON_AVAILABLE
+                else json.dumps(handoff.to_dict()),
             )
 
     async def get_pending_handoff(self, session_id: str) -> Optional[AgentHandoff]:
@@ -281,9 +276,7 @@ class HandoffService:
         if not row or not row["handoff"]:
             return None
 
-        import json
-
-        handoff_data = json.loads(row["handoff"])
+        handoff_data = orjson.loads(row["handoff"]) if ORJSON_AVAILABLE else json.loads(row["handoff"])
         return AgentHandoff.from_dict(handoff_data)
 
     async def consume_handoff(self, session_id: str) -> Optional[AgentHandoff]:
@@ -377,19 +370,27 @@ WORKFLOW_TRANSITIONS = {
 }
 
 
+def _index_transitions(
+    workflow_transitions: dict[str, list[dict]],
+) -> Mapping[str, Mapping[tuple[str, int], str]]:
+    """Index transitions by workflow, then (from chatmode, gate); the first definition wins."""
+    index = {}
+    for workflow, transitions in workflow_transitions.items():
+        by_step: dict[tuple[str, int], str] = {}
+        for transition in transitions:
+            by_step.setdefault((transition["from"], transition["after_gate"]), transition["to"])
+        index[workflow] = MappingProxyType(by_step)
+    return MappingProxyType(index)
+
+
+_NEXT_CHATMODE = _index_transitions(WORKFLOW_TRANSITIONS)
+_NO_TRANSITIONS: Mapping[tuple[str, int], str] = MappingProxyType({})
+
+
 def get_next_chatmode(workflow: str, current_chatmode: str, gate_passed: int) -> Optional[str]:
     """
     Determine the next chatmode after a validation gate passes.
 
     Returns None if no transition is defined.
     """
-    transitions = WORKFLOW_TRANSITIONS.get(workflow, [])
-
-    for transition in transitions:
-        if (
-            transition["from"] == current_chatmode
-            and transition["after_gate"] == gate_passed
-        ):
-            return transition["to"]
-
-    return None
+    return _NEXT_CHATMODE.get(workflow, _NO_TRANSITIONS).get((current_chatmode, gate_passed))
@@ -29,6 +29,7 @@ from .retrieval import (
 )
 from .pipeline import (
     MemoryGenerationPipeline,
+    MemoryCategory,
     CandidateMemory,
     ConsolidationResult,
     run_pipeline_for_session,
@@ -75,6 +76,7 @@ __all__ = [
     "RetrievedMemory",
     # Context Management - Pipeline
     "MemoryGenerationPipeline",
+    "MemoryCategory",
     "CandidateMemory",
     "ConsolidationResult",
     "run_pipeline_for_session",
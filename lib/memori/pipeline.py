@@ -11,9 +11,13 @@ Reference: docs/context-engineering/CONTEXT_MANAGEMENT_EVOLUTION_PROPOSAL.md
 """
 
 import json
+import math
 import re
+from collections import Counter
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
+from enum import Enum
 from typing import Optional, Protocol
 from loguru import logger
 
@@ -25,7 +29,16 @@ except ImportError:
     ASYNCPG_AVAILABLE = False
 
 
-@dataclass
+class MemoryCategory(str, Enum):
+    """Long-term memory categories."""
+    FACTS = "facts"
+    PREFERENCES = "preferences"
+    RULES = "rules"
+    SKILLS = "skills"
+    CONTEXT = "context"
+
+
+@dataclass(slots=True)
 class CandidateMemory:
     """A memory candidate extracted from session events."""
     content: str
@@ -35,6 +48,11 @@ class CandidateMemory:
     lineage: list[str] = field(default_factory=list)  # Event IDs that sourced this
     metadata: dict = field(default_factory=dict)
     importance: float = 0.5
+    # Lowercased word set of content, tokenized once for similarity checks
+    _shingles: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._shingles = frozenset(self.content.lower().split())
 
     def to_dict(self) -> dict:
         """Convert to dictionary for storage."""
@@ -80,7 +98,19 @@ class MemoryGenerationPipeline:
     """
 
     # Categories for memory extraction
-    MEMORY_CATEGORIES = ["facts", "preferences", "rules", "skills", "context"]
+    MEMORY_CATEGORIES = [category.value for category in MemoryCategory]
+
+    # Memory category for each extraction pattern category
+    PATTERN_CATEGORY_MAP = {
+        "user_correction": MemoryCategory.FACTS.value,
+        "decision": MemoryCategory.CONTEXT.value,
+        "anti_pattern": MemoryCategory.RULES.value,
+        "architecture": MemoryCategory.FACTS.value,
+    }
+
+    # Candidates whose word-set Jaccard similarity to a kept candidate exceeds
+    # this are dropped as duplicates
+    DUPLICATE_THRESHOLD = 0.8
 
     # Patterns for rule-based extraction (no LLM required)
     EXTRACTION_PATTERNS = {
@@ -107,6 +137,25 @@ class MemoryGenerationPipeline:
         ],
     }
 
+    # Literals at least one of which every match of the pattern contains.
+    # ASCII content lacking all of them (after lowercasing) skips that regex;
+    # patterns without an entry are always run.
+    PATTERN_TRIGGERS = {
+        r"(?:actually|no,?\s*)?(?:it'?s|that'?s|this is)\s+(.+)": ("it", "that", "this is"),
+        r"(?:please\s+)?(?:remember|note)\s+(?:that\s+)?(.+)": ("remember", "note"),
+        r"(?:i\s+)?prefer\s+(.+)": ("prefer",),
+        r"(?:always|never)\s+(.+)": ("always", "never"),
+        r"(?:we'?(?:ll|ve)\s+)?decided?\s+(?:to\s+)?(.+)": ("decide",),
+        r"(?:the\s+)?decision\s+(?:is|was)\s+(?:to\s+)?(.+)": ("decision",),
+        r"going\s+(?:to\s+|with\s+)(.+)": ("going",),
+        r"(?:don'?t|do\s+not|never)\s+(.+)": ("do", "never"),
+        r"(?:avoid|stop)\s+(.+ing)": ("avoid", "stop"),
+        r"(?:this|that)\s+(?:is|was)\s+(?:a\s+)?(?:bad|wrong|incorrect)": ("bad", "wrong", "incorrect"),
+        r"(?:the\s+)?architecture\s+(?:is|uses?|has)\s+(.+)": ("architecture",),
+        r"(?:we\s+)?use\s+(.+)\s+(?:for|to)\s+(.+)": ("use",),
+        r"(?:the\s+)?pattern\s+(?:is|for)\s+(.+)": ("pattern",),
+    }
+
     def __init__(
         self,
         db_url: str,
@@ -125,6 +174,18 @@ class MemoryGenerationPipeline:
         self.extractor = extractor
         self.similarity_threshold = similarity_threshold
         self._pool: Optional[asyncpg.Pool] = None
+        # (pattern category, memory category, trigger literals, compiled regex),
+        # built once rather than resolved through re's cache per event and pattern
+        self._compiled_patterns = [
+            (
+                category,
+                self._pattern_to_category(category),
+                self.PATTERN_TRIGGERS.get(pattern),
+                re.compile(pattern, re.IGNORECASE),
+            )
+            for category, patterns in self.EXTRACTION_PATTERNS.items()
+            for pattern in patterns
+        ]
 
     async def _get_pool(self) -> asyncpg.Pool:
         """Get or create connection pool."""
@@ -247,98 +308,147 @@ class MemoryGenerationPipeline:
         return candidates
 
     def _extract_by_patterns(self, events: list[dict]) -> list[CandidateMemory]:
-        """Extract memories using regex patterns."""
+        """
+        Extract memories using regex patterns.
+
+        Events may be row dicts (as loaded from session_events) or objects
+        exposing the same fields as attributes, such as SessionEvent.
+        """
         candidates = []
 
         for event in events:
-            content = event.get("content", "")
-            event_type = event.get("type", "")
-            role = event.get("role", "")
+            if isinstance(event, Mapping):
+                event_id = event["id"]
+                content = event.get("content", "")
+                role = event.get("role", "")
+            else:
+                event_id = event.id
+                content = getattr(event, "content", "")
+                role = getattr(event, "role", "")
 
             # Only process user messages and assistant messages
             if role not in ("user", "assistant"):
                 continue
 
+            # IGNORECASE folds some non-ASCII characters onto ASCII letters,
+            # so the trigger pre-check is only exact for ASCII content
+            lowered = content.lower() if content.isascii() else None
+
             # Check each pattern category
-            for category, patterns in self.EXTRACTION_PATTERNS.items():
-                for pattern in patterns:
-                    matches = re.findall(pattern, content, re.IGNORECASE)
-                    for match in matches:
-                        if isinstance(match, tuple):
-                            match = " ".join(match)
-
-                        # Skip very short matches
-                        if len(match) < 10:
-                            continue
-
-                        # Determine memory category
-                        mem_category = self._pattern_to_category(category)
-
-                        candidate = CandidateMemory(
-                            content=match.strip(),
-                            category=mem_category,
-                            source_type="pattern_match",
-                            confidence=0.6,  # Pattern matches have moderate confidence
-                            lineage=[event["id"]],
-                            metadata={
-                                "pattern_category": category,
-                                "source_role": role,
-                            },
-                            importance=0.5,
-                        )
-                        candidates.append(candidate)
+            for category, mem_category, triggers, pattern in self._compiled_patterns:
+                if lowered is not None and triggers and not any(t in lowered for t in triggers):
+                    continue
+                for match in pattern.findall(content):
+                    if isinstance(match, tuple):
+                        match = " ".join(match)
+
+                    # Skip very short matches
+                    if len(match) < 10:
+                        continue
+
+                    candidate = CandidateMemory(
+                        content=match.strip(),
+                        category=mem_category,
+                        source_type="pattern_match",
+                        confidence=0.6,  # Pattern matches have moderate confidence
+                        lineage=[event_id],
+                        metadata={
+                            "pattern_category": category,
+                            "source_role": role,
+                        },
+                        importance=0.5,
+                    )
+                    candidates.append(candidate)
 
         return candidates
 
     def _pattern_to_category(self, pattern_category: str) -> str:
         """Map pattern category to memory category."""
-        mapping = {
-            "user_correction": "facts",
-            "decision": "context",
-            "anti_pattern": "rules",
-            "architecture": "facts",
-        }
-        return mapping.get(pattern_category, "context")
+        return self.PATTERN_CATEGORY_MAP.get(pattern_category, MemoryCategory.CONTEXT.value)
 
     def _deduplicate_candidates(
         self, candidates: list[CandidateMemory]
     ) -> list[CandidateMemory]:
-        """Remove duplicate candidates by content similarity."""
+        """
+        Remove duplicate candidates by content similarity.
+
+        A candidate is dropped when its similarity to an earlier kept candidate
+        exceeds DUPLICATE_THRESHOLD. Rather than comparing every pair, kept
+        candidates are indexed by a short prefix of their words (rarest first):
+        two word sets with Jaccard > t must share a word within those prefixes,
+        so only candidates meeting in the index are compared exactly.
+        Verbatim repeats (same words after lowercasing and collapsing
+        whitespace) are caught first by a dict lookup on the joined words.
+        """
         if not candidates:
             return []
 
+        threshold = self.DUPLICATE_THRESHOLD
+        # Normalize content for the verbatim-repeat check
+        tokens = [candidate.content.lower().split() for candidate in candidates]
+        word_freq = Counter(word for candidate in candidates for word in candidate._shingles)
+
         unique = []
-        seen_content = set()
+        prefix_index: dict[str, list[int]] = {}
+        seen_exact: set[str] = set()
+
+        for candidate, split in zip(candidates, tokens):
+            words = candidate._shingles
+            # An exact repeat has similarity 1.0 to whatever absorbed the first copy
+            exact_key = " ".join(split)
+            if exact_key in seen_exact:
+                continue
+            if words:
+                seen_exact.add(exact_key)
 
-        for candidate in candidates:
-            # Normalize content for comparison
-            normalized = candidate.content.lower().strip()
+            ordered = sorted(words, key=lambda word: (word_freq[word], word))
+            # Jaccard > t needs overlap > t*len(words), so some shared word
+            # lies in the first len - floor(t*len) words (epsilon keeps it conservative)
+            prefix = ordered[:len(ordered) - math.floor(threshold * len(ordered) - 1e-9)]
 
             # Skip if too similar to existing
             is_duplicate = False
-            for seen in seen_content:
-                if self._text_similarity(normalized, seen) > 0.8:
-                    is_duplicate = True
+            checked: set[int] = set()
+            for word in prefix:
+                for kept in prefix_index.get(word, ()):
+                    if kept in checked:
+                        continue
+                    checked.add(kept)
+                    if self._text_similarity(candidate, unique[kept]) > threshold:
+                        is_duplicate = True
+                        break
+                if is_duplicate:
                     break
 
             if not is_duplicate:
+                for word in prefix:
+                    prefix_index.setdefault(word, []).append(len(unique))
                 unique.append(candidate)
-                seen_content.add(normalized)
 
         return unique
 
-    def _text_similarity(self, text1: str, text2: str) -> float:
-        """Calculate simple text similarity (Jaccard on words)."""
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
+    def _text_similarity(
+        self,
+        text1: str | CandidateMemory,
+        text2: str | CandidateMemory,
+    ) -> float:
+        """
+        Calculate simple text similarity (Jaccard on words).
+
+        Accepts raw strings or CandidateMemory instances; candidates reuse
+        their cached word sets instead of being re-tokenized per comparison.
+        """
+        words1 = text1._shingles if isinstance(text1, CandidateMemory) else set(text1.lower().split())
+        words2 = text2._shingles if isinstance(text2, CandidateMemory) else set(text2.lower().split())
 
         if not words1 or not words2:
             return 0.0
 
+        # |A ∪ B| = |A| + |B| - |A ∩ B|, so the union set is never built
         intersection = len(words1 & words2)
-        union = len(words1 | words2)
+        union = len(words1) + len(words2) - intersection
 
-        return intersection / union if union > 0 else 0.0
+        return intersection / union
 
     async def consolidate_memory(
         self,
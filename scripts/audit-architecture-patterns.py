@@ -11,16 +11,173 @@ Audits:
 - Anti-patterns and prohibitions
 """
 
+import hashlib
+import io
+import os
 import re
+import sqlite3
+import sys
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from collections import defaultdict
-from typing import Dict, List, Set
+from contextlib import closing
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, TextIO, Tuple
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Worker processes for scanning documents (one is scanned in-process)
+MAX_SCAN_WORKERS = os.cpu_count() or 1
+# Threads reading document files concurrently
+MAX_READ_WORKERS = 16
+# Per-document scan results, reused while a file's mtime and size are unchanged
+# (at the repo root, whichever directory the audit is launched from)
+SCAN_CACHE_PATH = Path(__file__).resolve().parent.parent / '.audit-cache.sqlite'
+# Bump when scanning changes in a way that invalidates cached statements
+SCAN_CACHE_VERSION = 3
+
+
+# Directive labels, interned so every statement shares one object and
+# directive comparisons short-circuit on identity
+REQUIRED = sys.intern('REQUIRED')
+PROHIBITED = sys.intern('PROHIBITED')
+OPTIONAL = sys.intern('OPTIONAL')
+NEUTRAL = sys.intern('NEUTRAL')
+
+# Directive vocabularies, checked in order: prohibitive, prescriptive,
+# permissive. Markers match as substrings, so 'use' also hits 'because'
+_DIRECTIVE_MARKERS = (
+    (PROHIBITED, ('ban', 'never', 'must not', 'do not', "don't", 'forbidden',
+                  'prohibited', 'anti-pattern', '❌', 'avoid')),
+    (REQUIRED, ('must', 'should', 'require', 'enforce', 'always', '✅', 'use', 'implement')),
+    (OPTIONAL, ('can', 'may', 'optional', 'allowed')),
+)
+
+
+def _mentioning(entries: List[dict], field: str, term: str) -> List[dict]:
+    """Entries whose lowercased field contains term, in their original order."""
+    return [entry for entry in entries if term in entry[field].lower()]
+
+
+@dataclass(slots=True)
+class PatternStatement:
+    """A directive-bearing line matched by a category keyword."""
+    line: int
+    keyword: str
+    directive: str
+    statement: str
+    context: str
+
+    def to_dict(self) -> dict:
+        """Convert to a dictionary for the JSON report."""
+        return {
+            'line': self.line,
+            'keyword': self.keyword,
+            'directive': self.directive,
+            'statement': self.statement,
+            'context': self.context
+        }
+
+
+def _read_text(file_path: Path) -> Tuple[Optional[str], Optional[Exception]]:
+    """Read a document as UTF-8, returning (content, None) or (None, error)."""
+    try:
+        return file_path.read_text(encoding='utf-8'), None
+    except Exception as e:
+        return None, e
+
+
+def _fingerprint(file_path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it cannot be stat'ed."""
+    try:
+        st = file_path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _interned(category: str, statement: PatternStatement) -> Tuple[str, PatternStatement]:
+    """Re-intern the shared strings of a statement built outside this process's scan."""
+    statement.keyword = sys.intern(statement.keyword)
+    statement.directive = sys.intern(statement.directive)
+    return sys.intern(category), statement
+
+
+def _write_json(obj, path: Path):
+    """
+    Write obj as 2-space indented UTF-8 JSON, using orjson when it is installed.
+
+    Both paths write identical bytes: non-ASCII text is kept as UTF-8
+    rather than \\u-escaped, matching orjson's output.
+    """
+    if ORJSON_AVAILABLE:
+        # Serializes in C and writes UTF-8 bytes in one call
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        # One join and one write instead of a write per encoded chunk
+        path.write_bytes(json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8'))
+
+
+def _scan_document(doc: dict, keywords: List[Tuple[str, str, str]]) -> List[Tuple[str, PatternStatement]]:
+    """
+    Scan one loaded document for keyword statements.
+
+    Module-level so worker processes can run it; returns (category, statement)
+    pairs in keyword then position order.
+    """
+    content, content_lower = doc['content'], doc['content_lower']
+    newlines, content_newlines = doc['newlines'], doc['content_newlines']
+    statements = []
+
+    for category, keyword, keyword_lower in keywords:
+        # Find all non-overlapping occurrences of this keyword; a plain
+        # substring search beats re.finditer on an escaped literal
+        step = len(keyword_lower)
+        start_pos = content_lower.find(keyword_lower)
+        while start_pos != -1:
+            # Get the full line and surrounding context
+            line_index = bisect_right(newlines, start_pos)
+            line_num = line_index + 1
+            line_start = newlines[line_index - 1] + 1 if line_index else 0
+            line_end = newlines[line_index] if line_index < len(newlines) else len(content_lower)
+
+            # Determine directive (should/must/never/ban/etc)
+            directive = PatternAuditor._extract_directive(content_lower[line_start:line_end])
+
+            if directive:
+                # lower() can change the length of some non-ASCII text, so
+                # the display line is bounded by the original content's own
+                # newline offsets (the line count is the same in both)
+                if content_newlines is not newlines:
+                    line_start = content_newlines[line_index - 1] + 1 if line_index else 0
+                    line_end = content_newlines[line_index] if line_index < len(content_newlines) else len(content)
+
+                statements.append((category, PatternStatement(
+                    line=line_num,
+                    keyword=keyword,
+                    directive=directive,
+                    statement=content[line_start:line_end].strip(),
+                    context=PatternAuditor._get_context(doc, line_num, 2)
+                )))
+
+            start_pos = content_lower.find(keyword_lower, start_pos + step)
+
+    return statements
+
 
 class PatternAuditor:
-    def __init__(self, docs_dir: Path):
+    def __init__(self, docs_dir: Path, use_cache: bool = True):
         self.docs_dir = docs_dir
+        self.use_cache = use_cache
         self.documents = {}
         self.patterns = defaultdict(lambda: defaultdict(list))
         self.contradictions = []
@@ -51,6 +208,18 @@ class PatternAuditor:
             }
         }
 
+        # (category, keyword, lowercased keyword), lowercased once instead
+        # of per document
+        self._keywords = [
+            (sys.intern(category), sys.intern(keyword), keyword.lower())
+            for category, config in self.pattern_categories.items()
+            for keyword in config['keywords']
+        ]
+        # Cached scans are only valid for the same keywords and scan logic
+        self._cache_key = hashlib.sha1(
+            repr((SCAN_CACHE_VERSION, self._keywords)).encode()
+        ).hexdigest()
+
     def load_architecture_docs(self):
         """Load only core architecture documents"""
         print("📂 Loading architecture documents...")
@@ -62,17 +231,48 @@ class PatternAuditor:
             'adr/*.md'
         ]
 
-        for pattern in patterns:
-            for file_path in self.docs_dir.glob(pattern):
+        # Overlapping globs would match a file twice; keep first-match order
+        file_paths = list(dict.fromkeys(
+            file_path for pattern in patterns for file_path in self.docs_dir.glob(pattern)
+        ))
+
+        fingerprints = [_fingerprint(file_path) for file_path in file_paths]
+        cached = self._load_cached_scans(file_paths, fingerprints) if self.use_cache else {}
+
+        # Reads release the GIL, so overlap them; results come back in path order
+        with ThreadPoolExecutor(max_workers=MAX_READ_WORKERS) as executor:
+            reads = executor.map(_read_text, [p for p in file_paths if p not in cached])
+
+            for file_path, fingerprint in zip(file_paths, fingerprints):
+                rel_path = file_path.relative_to(self.docs_dir)
+                if file_path in cached:
+                    # Unchanged since the cached scan: no need to read it
+                    self.documents[str(rel_path)] = {
+                        'path': file_path,
+                        'fingerprint': fingerprint,
+                        'statements': cached[file_path],
+                    }
+                    continue
+
+                content, error = next(reads)
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        rel_path = file_path.relative_to(self.docs_dir)
-                        self.documents[str(rel_path)] = {
-                            'path': file_path,
-                            'content': content,
-                            'lines': content.split('\n')
-                        }
+                    if error is not None:
+                        raise error
+                    content_lower = content.lower()
+                    # Newline offsets, so each match's line is a binary
+                    # search rather than a count over everything before it
+                    newlines = array('l', (m.start() for m in re.finditer('\n', content_lower)))
+                    self.documents[str(rel_path)] = {
+                        'path': file_path,
+                        'fingerprint': fingerprint,
+                        'content': content,
+                        'content_lower': content_lower,
+                        'newlines': newlines,
+                        # Context is sliced from content by line; lower() can
+                        # change the length of some non-ASCII text
+                        'content_newlines': newlines if len(content_lower) == len(content)
+                        else array('l', (m.start() for m in re.finditer('\n', content))),
+                    }
                 except Exception as e:
                     print(f"⚠️  Error loading {file_path}: {e}")
 
@@ -82,64 +282,120 @@ class PatternAuditor:
         """Extract statements about each pattern category"""
         print("🔍 Extracting pattern statements...\n")
 
+        doc_paths = [path for path, doc in self.documents.items() if 'statements' not in doc]
+        docs = [self.documents[path] for path in doc_paths]
+        workers = min(MAX_SCAN_WORKERS, len(docs))
+
+        reused = len(self.documents) - len(docs)
+        if reused:
+            print(f"♻️  {reused} unchanged documents reused from {SCAN_CACHE_PATH} (--no-cache to rescan)\n")
+
+        if workers < 2:
+            results = [_scan_document(doc, self._keywords) for doc in docs]
+        else:
+            # Documents scan independently; map() keeps input order, so the
+            # statements are merged exactly as a sequential scan would add them
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(
+                    _scan_document, docs, repeat(self._keywords),
+                    chunksize=max(1, len(docs) // (workers * 4))
+                ))
+
+        if workers >= 2:
+            # Unpickled strings are fresh copies per worker batch; re-intern
+            # so every statement shares the same objects
+            results = [[_interned(category, statement) for category, statement in statements]
+                       for statements in results]
+
+        scanned = dict(zip(doc_paths, results))
+        if self.use_cache and scanned:
+            self._save_scans(scanned)
+
+        # Merge in document order, so cached and scanned documents land
+        # exactly where a full scan would have put them
         for doc_path, doc in self.documents.items():
-            content_lower = doc['content'].lower()
-
-            for category, config in self.pattern_categories.items():
-                for keyword in config['keywords']:
-                    keyword_lower = keyword.lower()
-
-                    # Find all occurrences of this keyword
-                    for match in re.finditer(re.escape(keyword_lower), content_lower):
-                        start_pos = match.start()
-
-                        # Get the full line and surrounding context
-                        line_num = content_lower[:start_pos].count('\n') + 1
-                        line_start = content_lower.rfind('\n', 0, start_pos) + 1
-                        line_end = content_lower.find('\n', start_pos)
-                        if line_end == -1:
-                            line_end = len(content_lower)
-
-                        full_line = doc['content'][line_start:line_end]
-
-                        # Determine directive (should/must/never/ban/etc)
-                        directive = self._extract_directive(full_line)
-
-                        if directive:
-                            self.patterns[category][doc_path].append({
-                                'line': line_num,
-                                'keyword': keyword,
-                                'directive': directive,
-                                'statement': full_line.strip(),
-                                'context': self._get_context(doc['lines'], line_num, 2)
-                            })
-
-    def _extract_directive(self, text: str) -> str:
-        """Extract the directive (prescriptive/prohibitive/neutral)"""
-        text_lower = text.lower()
-
-        # Prohibitive patterns (anti-patterns, bans)
-        if any(word in text_lower for word in ['ban', 'never', 'must not', 'do not',
-                                                 'don\'t', 'forbidden', 'prohibited',
-                                                 'anti-pattern', '❌', 'avoid']):
-            return 'PROHIBITED'
-
-        # Prescriptive patterns (requirements)
-        if any(word in text_lower for word in ['must', 'should', 'require', 'enforce',
-                                                 'always', '✅', 'use', 'implement']):
-            return 'REQUIRED'
-
-        # Permissive
-        if any(word in text_lower for word in ['can', 'may', 'optional', 'allowed']):
-            return 'OPTIONAL'
-
-        return 'NEUTRAL'
-
-    def _get_context(self, lines: List[str], line_num: int, context_lines: int = 2) -> str:
-        """Get surrounding lines for context"""
+            statements = scanned[doc_path] if doc_path in scanned else doc['statements']
+            for category, statement in statements:
+                self.patterns[category][doc_path].append(statement)
+
+    def _load_cached_scans(self, file_paths: List[Path],
+                           fingerprints: List[Optional[Tuple[int, int]]]) -> Dict[Path, list]:
+        """Cached (category, statement) pairs for files unchanged since their last scan."""
+        cached = {}
+        try:
+            with closing(sqlite3.connect(SCAN_CACHE_PATH)) as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS scans (path TEXT PRIMARY KEY, "
+                    "mtime_ns INTEGER, size INTEGER, cache_key TEXT, statements TEXT)"
+                )
+                rows = {
+                    path: row for path, *row in conn.execute(
+                        "SELECT path, mtime_ns, size, cache_key, statements FROM scans"
+                    )
+                }
+        except sqlite3.Error as e:
+            print(f"⚠️  Could not read scan cache: {e}")
+            return cached
+
+        for file_path, fingerprint in zip(file_paths, fingerprints):
+            row = rows.get(str(file_path.resolve()))
+            if fingerprint is None or row is None:
+                continue
+            mtime_ns, size, cache_key, statements = row
+            if (mtime_ns, size) != fingerprint or cache_key != self._cache_key:
+                continue
+            # Plain JSON rows, so reading the cache never executes code
+            try:
+                cached[file_path] = [
+                    _interned(category, PatternStatement(*fields))
+                    for category, *fields in json.loads(statements)
+                ]
+            except (TypeError, ValueError):
+                continue  # Unreadable entry: rescan the file
+        return cached
+
+    def _save_scans(self, scanned: Dict[str, list]):
+        """Store freshly scanned statements, keyed by file path and fingerprint."""
+        rows = []
+        for doc_path, statements in scanned.items():
+            doc = self.documents[doc_path]
+            if doc['fingerprint'] is None:
+                continue
+            rows.append((str(doc['path'].resolve()), *doc['fingerprint'], self._cache_key, json.dumps([
+                (category, stmt.line, stmt.keyword, stmt.directive, stmt.statement, stmt.context)
+                for category, stmt in statements
+            ])))
+
+        try:
+            # One transaction for every row
+            with closing(sqlite3.connect(SCAN_CACHE_PATH)) as conn, conn:
+                conn.executemany("INSERT OR REPLACE INTO scans VALUES (?, ?, ?, ?, ?)", rows)
+        except sqlite3.Error as e:
+            print(f"⚠️  Could not write scan cache: {e}")
+
+    @staticmethod
+    def _extract_directive(text_lower: str) -> str:
+        """Extract the directive (prescriptive/prohibitive/neutral) from lowercased text"""
+        # First vocabulary with a marker anywhere in the text wins; literal
+        # substring tests are about twice as fast as an alternation regex
+        for directive, markers in _DIRECTIVE_MARKERS:
+            for marker in markers:
+                if marker in text_lower:
+                    return directive
+
+        return NEUTRAL
+
+    @staticmethod
+    def _get_context(doc: dict, line_num: int, context_lines: int = 2) -> str:
+        """Get surrounding lines for context, sliced from the document by line offsets"""
+        content, newlines = doc['content'], doc['content_newlines']
         start = max(0, line_num - context_lines - 1)
-        end = min(len(lines), line_num + context_lines)
-        return '\n'.join(lines[start:end])
+        end = min(len(newlines) + 1, line_num + context_lines)
+        if start >= end:
+            return ''
+        begin = newlines[start - 1] + 1 if start else 0
+        finish = newlines[end - 1] if end <= len(newlines) else len(content)
+        return content[begin:finish]
 
     def detect_pattern_contradictions(self):
         """Detect contradictions in architectural patterns"""
@@ -157,10 +413,10 @@ class PatternAuditor:
 
             for doc_path, statements in doc_patterns.items():
                 for stmt in statements:
-                    if stmt['directive'] == 'REQUIRED':
-                        required.append({**stmt, 'source': doc_path})
-                    elif stmt['directive'] == 'PROHIBITED':
-                        prohibited.append({**stmt, 'source': doc_path})
+                    if stmt.directive == REQUIRED:
+                        required.append({**stmt.to_dict(), 'source': doc_path})
+                    elif stmt.directive == PROHIBITED:
+                        prohibited.append({**stmt.to_dict(), 'source': doc_path})
 
             # Check for conflicts between required and prohibited
             if required and prohibited:
@@ -178,65 +434,61 @@ class PatternAuditor:
         """Find actual semantic conflicts (not just keyword matches)"""
         conflicts = []
 
-        # Category-specific conflict detection
+        # Category-specific conflict detection. Each branch partitions the
+        # statements mentioning its concept once, then derives both the
+        # conflict test and the evidence lists from those partitions.
         if category == 'service_implementation':
             # Check if classes are both required and prohibited
-            classes_required = any('class' in r['keyword'].lower() and
-                                  'factory' not in r['statement'].lower()
-                                  for r in required)
-            classes_prohibited = any('class' in p['keyword'].lower()
-                                    for p in prohibited)
+            required_classes = _mentioning(required, 'keyword', 'class')
+            prohibited_classes = _mentioning(prohibited, 'keyword', 'class')
+            classes_required = any('factory' not in r['statement'].lower()
+                                   for r in required_classes)
 
-            if classes_required and classes_prohibited:
+            if classes_required and prohibited_classes:
                 conflicts.append({
                     'issue': 'Class-based services',
-                    'required_by': [r for r in required if 'class' in r['keyword'].lower()],
-                    'prohibited_by': [p for p in prohibited if 'class' in p['keyword'].lower()]
+                    'required_by': required_classes,
+                    'prohibited_by': prohibited_classes
                 })
 
         elif category == 'type_inference':
             # Check ReturnType guidance
-            returntype_allowed = any('returntype' in r['statement'].lower() and
-                                    'use' in r['statement'].lower()
-                                    for r in required)
-            returntype_banned = any('returntype' in p['statement'].lower()
-                                   for p in prohibited)
+            required_returntype = _mentioning(required, 'statement', 'returntype')
+            prohibited_returntype = _mentioning(prohibited, 'statement', 'returntype')
+            returntype_allowed = any('use' in r['statement'].lower()
+                                     for r in required_returntype)
 
-            if returntype_allowed and returntype_banned:
+            if returntype_allowed and prohibited_returntype:
                 conflicts.append({
                     'issue': 'ReturnType usage',
-                    'required_by': [r for r in required if 'returntype' in r['statement'].lower()],
-                    'prohibited_by': [p for p in prohibited if 'returntype' in p['statement'].lower()]
+                    'required_by': required_returntype,
+                    'prohibited_by': prohibited_returntype
                 })
 
         elif category == 'supabase_client':
             # Check if 'any' typing is both required and prohibited
-            any_required = any('any' in r['statement'].lower() and
-                              'use' in r['statement'].lower()
-                              for r in required)
-            any_prohibited = any('any' in p['statement'].lower()
-                                for p in prohibited)
+            required_any = _mentioning(required, 'statement', 'any')
+            prohibited_any = _mentioning(prohibited, 'statement', 'any')
+            any_required = any('use' in r['statement'].lower() for r in required_any)
 
-            if any_required and any_prohibited:
+            if any_required and prohibited_any:
                 conflicts.append({
                     'issue': 'Supabase client typing with any',
-                    'required_by': [r for r in required if 'any' in r['statement'].lower()],
-                    'prohibited_by': [p for p in prohibited if 'any' in p['statement'].lower()]
+                    'required_by': required_any,
+                    'prohibited_by': prohibited_any
                 })
 
         elif category == 'exports':
             # Check export pattern consistency
-            default_required = any('default' in r['statement'].lower() and
-                                  'use' in r['statement'].lower()
-                                  for r in required)
-            default_prohibited = any('default' in p['statement'].lower()
-                                    for p in prohibited)
+            required_default = _mentioning(required, 'statement', 'default')
+            prohibited_default = _mentioning(prohibited, 'statement', 'default')
+            default_required = any('use' in r['statement'].lower() for r in required_default)
 
-            if default_required and default_prohibited:
+            if default_required and prohibited_default:
                 conflicts.append({
                     'issue': 'Default vs named exports',
-                    'required_by': [r for r in required if 'default' in r['statement'].lower()],
-                    'prohibited_by': [p for p in prohibited if 'default' in p['statement'].lower()]
+                    'required_by': required_default,
+                    'prohibited_by': prohibited_default
                 })
 
         return conflicts
@@ -254,9 +506,9 @@ class PatternAuditor:
             doc_patterns = self.patterns[category]
 
             required_count = sum(1 for doc in doc_patterns.values()
-                               for stmt in doc if stmt['directive'] == 'REQUIRED')
+                               for stmt in doc if stmt.directive == REQUIRED)
             prohibited_count = sum(1 for doc in doc_patterns.values()
-                                 for stmt in doc if stmt['directive'] == 'PROHIBITED')
+                                 for stmt in doc if stmt.directive == PROHIBITED)
 
             summary['patterns_by_category'][category] = {
                 'description': config['description'],
@@ -273,82 +525,92 @@ class PatternAuditor:
             'summary': self.generate_pattern_summary(),
             'contradictions': self.contradictions,
             'pattern_details': {
-                category: dict(patterns)
+                category: {
+                    doc_path: [stmt.to_dict() for stmt in statements]
+                    for doc_path, statements in patterns.items()
+                }
                 for category, patterns in self.patterns.items()
             }
         }
 
     def generate_markdown_report(self) -> str:
         """Generate human-readable markdown report"""
+        buffer = io.StringIO()
+        self.write_markdown_report(buffer)
+        return buffer.getvalue()
+
+    def write_markdown_report(self, out: TextIO):
+        """Write the human-readable markdown report to a text stream, piece by piece"""
         report = self.generate_report()
         summary = report['summary']
+        write = out.write
 
-        md = "# Architecture Pattern Consistency Audit\n\n"
-        md += f"**Scope**: System patterns, anti-patterns, and architectural decisions\n"
-        md += f"**Documents**: {summary['documents_analyzed']}\n\n"
+        write("# Architecture Pattern Consistency Audit\n\n")
+        write(f"**Scope**: System patterns, anti-patterns, and architectural decisions\n")
+        write(f"**Documents**: {summary['documents_analyzed']}\n\n")
 
-        md += "## Executive Summary\n\n"
-        md += f"- **Pattern Categories Analyzed**: {summary['pattern_categories']}\n"
-        md += f"- **Contradictions Found**: {summary['contradictions_found']}\n\n"
+        write("## Executive Summary\n\n")
+        write(f"- **Pattern Categories Analyzed**: {summary['pattern_categories']}\n")
+        write(f"- **Contradictions Found**: {summary['contradictions_found']}\n\n")
 
         # Pattern summary by category
-        md += "## Pattern Categories\n\n"
+        write("## Pattern Categories\n\n")
         for category, info in summary['patterns_by_category'].items():
-            md += f"### {category.replace('_', ' ').title()}\n\n"
-            md += f"**Description**: {info['description']}\n\n"
-            md += f"- Documents mentioning: {info['documents_mentioning']}\n"
-            md += f"- REQUIRED statements: {info['required_statements']}\n"
-            md += f"- PROHIBITED statements: {info['prohibited_statements']}\n"
-            md += f"- **Status**: "
+            write(f"### {category.replace('_', ' ').title()}\n\n")
+            write(f"**Description**: {info['description']}\n\n")
+            write(f"- Documents mentioning: {info['documents_mentioning']}\n")
+            write(f"- REQUIRED statements: {info['required_statements']}\n")
+            write(f"- PROHIBITED statements: {info['prohibited_statements']}\n")
+            write(f"- **Status**: ")
 
             if info['required_statements'] > 0 and info['prohibited_statements'] == 0:
-                md += "✅ Clear guidance (prescribed)\n"
+                write("✅ Clear guidance (prescribed)\n")
             elif info['prohibited_statements'] > 0 and info['required_statements'] == 0:
-                md += "✅ Clear guidance (anti-pattern)\n"
+                write("✅ Clear guidance (anti-pattern)\n")
             elif info['required_statements'] > 0 and info['prohibited_statements'] > 0:
-                md += "⚠️  Mixed guidance (check for contradictions)\n"
+                write("⚠️  Mixed guidance (check for contradictions)\n")
             else:
-                md += "ℹ️  Neutral (no strong guidance)\n"
+                write("ℹ️  Neutral (no strong guidance)\n")
 
-            md += "\n"
+            write("\n")
 
         # Contradictions
         if report['contradictions']:
-            md += "## Contradictions Found\n\n"
+            write("## Contradictions Found\n\n")
             for i, contradiction in enumerate(report['contradictions'], 1):
-                md += f"### C{i:03d}: {contradiction['description']}\n\n"
-                md += f"**Category**: {contradiction['category']}\n\n"
+                write(f"### C{i:03d}: {contradiction['description']}\n\n")
+                write(f"**Category**: {contradiction['category']}\n\n")
 
                 for conflict in contradiction['conflicts']:
-                    md += f"#### Issue: {conflict['issue']}\n\n"
+                    write(f"#### Issue: {conflict['issue']}\n\n")
 
                     if conflict.get('required_by'):
-                        md += "**Required by**:\n"
+                        write("**Required by**:\n")
                         for req in conflict['required_by'][:3]:  # Limit to 3 examples
-                            md += f"- `{req['source']}:{req['line']}` - {req['statement'][:100]}...\n"
-                        md += "\n"
+                            write(f"- `{req['source']}:{req['line']}` - {req['statement'][:100]}...\n")
+                        write("\n")
 
                     if conflict.get('prohibited_by'):
-                        md += "**Prohibited by**:\n"
+                        write("**Prohibited by**:\n")
                         for proh in conflict['prohibited_by'][:3]:  # Limit to 3 examples
-                            md += f"- `{proh['source']}:{proh['line']}` - {proh['statement'][:100]}...\n"
-                        md += "\n"
+                            write(f"- `{proh['source']}:{proh['line']}` - {proh['statement'][:100]}...\n")
+                        write("\n")
         else:
-            md += "## ✅ No Contradictions Found\n\n"
-            md += "All architectural patterns are consistent across documents.\n\n"
+            write("## ✅ No Contradictions Found\n\n")
+            write("All architectural patterns are consistent across documents.\n\n")
 
         # Detailed pattern statements
-        md += "## Detailed Pattern Statements\n\n"
+        write("## Detailed Pattern Statements\n\n")
         for category, config in self.pattern_categories.items():
             doc_patterns = self.patterns[category]
 
             if not doc_patterns:
                 continue
 
-            md += f"### {category.replace('_', ' ').title()}\n\n"
+            write(f"### {category.replace('_', ' ').title()}\n\n")
 
             for doc_path, statements in sorted(doc_patterns.items()):
-                md += f"#### {doc_path}\n\n"
+                write(f"#### {doc_path}\n\n")
 
                 for stmt in statements:
                     directive_symbol = {
@@ -356,22 +618,21 @@ class PatternAuditor:
                         'PROHIBITED': '❌',
                         'OPTIONAL': '⚪',
                         'NEUTRAL': 'ℹ️'
-                    }.get(stmt['directive'], '•')
+                    }.get(stmt.directive, '•')
 
-                    md += f"{directive_symbol} **Line {stmt['line']}** ({stmt['directive']})\n"
-                    md += f"   - Keyword: `{stmt['keyword']}`\n"
-                    md += f"   - Statement: {stmt['statement']}\n\n"
+                    write(f"{directive_symbol} **Line {stmt.line}** ({stmt.directive})\n")
+                    write(f"   - Keyword: `{stmt.keyword}`\n")
+                    write(f"   - Statement: {stmt.statement}\n\n")
 
-        md += "---\n\n*End of Architecture Pattern Audit*\n"
+        write("---\n\n*End of Architecture Pattern Audit*\n")
 
-        return md
 
 
 def main():
-    import sys
     from datetime import datetime
 
     docs_dir = Path('docs')
+    use_cache = '--no-cache' not in sys.argv[1:]
 
     if not docs_dir.exists():
         print(f"❌ Error: Directory {docs_dir} does not exist")
@@ -385,7 +646,7 @@ def main():
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print()
 
-    auditor = PatternAuditor(docs_dir)
+    auditor = PatternAuditor(docs_dir, use_cache=use_cache)
 
     # Run audit
     auditor.load_architecture_docs()
@@ -397,15 +658,13 @@ def main():
 
     # Save JSON report
     json_path = Path('architecture-pattern-audit.json')
-    with open(json_path, 'w') as f:
-        json.dump(report, f, indent=2)
+    _write_json(report, json_path)
     print(f"💾 JSON report saved: {json_path}")
 
     # Save Markdown report
-    md_report = auditor.generate_markdown_report()
     md_path = Path('architecture-pattern-audit.md')
     with open(md_path, 'w') as f:
-        f.write(md_report)
+        auditor.write_markdown_report(f)
     print(f"💾 Markdown report saved: {md_path}")
 
     # Print summary
@@ -8,12 +8,87 @@ Phase 0.1 of Documentation Audit & Reconciliation
 
 import re
 import json
+from array import array
+from bisect import bisect_left, bisect_right
 from pathlib import Path
 from collections import defaultdict
-from typing import Dict, List, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple, Any
 from difflib import SequenceMatcher
 
 
+# Threads reading document files concurrently
+MAX_READ_WORKERS = 16
+
+# Patterns are compiled once at import rather than looked up in re's
+# cache for every document
+
+TECH_PATTERNS = {
+    tech: re.compile(pattern, re.IGNORECASE)
+    for tech, pattern in {
+        'Next.js': r'Next\.js\s*(?:v?(\d+(?:\.\d+)*))?',
+        'Supabase': r'Supabase\s*(?:v?(\d+(?:\.\d+)*))?',
+        'React Query': r'React\s+Query\s*(?:v?(\d+(?:\.\d+)*))?|@tanstack/react-query',
+        'Zustand': r'Zustand\s*(?:v?(\d+(?:\.\d+)*))?',
+        'shadcn': r'shadcn(?:/ui)?\s*(?:v?(\d+(?:\.\d+)*))?',
+        'TypeScript': r'TypeScript\s*(?:v?(\d+(?:\.\d+)*))?',
+    }.items()
+}
+
+PATTERN_KEYWORDS = [
+    re.compile(pattern, re.MULTILINE)
+    for pattern in [
+        r'(service|Service)s?\s+(should|SHOULD|must|MUST|MUST NOT|never|NEVER|cannot|CANNOT)',
+        r'(type|Type)s?\s+(should|SHOULD|must|MUST|MUST NOT|never|NEVER)',
+        r'(hook|Hook)s?\s+(should|SHOULD|must|MUST|MUST NOT|never|NEVER)',
+        r'(component|Component)s?\s+(should|SHOULD|must|MUST|MUST NOT|never|NEVER)',
+        r'(DO NOT|❌|anti-pattern|forbidden|prohibited|deprecated)',
+        r'(functional factories|class-based|classes)',
+        r'(ReturnType|explicit interfaces)',
+        r'(global|singleton|stateful)',
+    ]
+]
+
+TEMPORAL_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        r'(Phase\s+\d+)\s+is\s+(\d+%)\s+complete',
+        r'(Week\s+\d+)',
+        r'(Wave\s+\d+)',
+        r'(\d{4}-\d{2}-\d{2})',
+        r'(Status|STATUS):\s*(\w+)',
+        r'(completed?|in[- ]?progress|pending)',
+    ]
+]
+
+# Pattern for markdown links: [text](path)
+LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+# Repeated explanations of these concepts are reported as redundancy
+KEY_CONCEPTS = [
+    'service layer',
+    'type safety',
+    'real-time',
+    'state management',
+    'anti-pattern',
+]
+CONCEPT_HEADING_PATTERNS = {
+    concept: re.compile(rf'#{1,3}\s*.*{re.escape(concept)}.*', re.IGNORECASE)
+    for concept in KEY_CONCEPTS
+}
+
+PHASE_COMPLETION_PATTERN = re.compile(r'(Phase\s+\d+)\s+is\s+(\d+)%\s+complete', re.IGNORECASE)
+NEXT_HEADING_PATTERN = re.compile(r'\n#{1,6}\s')
+
+
+def _read_text(file_path: Path) -> Tuple[Optional[str], Optional[Exception]]:
+    """Read a document as UTF-8, returning (content, None) or (None, error)."""
+    try:
+        return file_path.read_text(encoding='utf-8'), None
+    except Exception as e:
+        return None, e
+
+
 class ConsistencyAuditor:
     def __init__(self, docs_dir: Path):
         self.docs_dir = docs_dir
@@ -29,18 +104,25 @@ class ConsistencyAuditor:
         print("📂 Loading documentation files...")
         md_files = list(self.docs_dir.rglob('*.md'))
 
-        for file_path in md_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+        # Reads release the GIL, so overlap them; results come back in path order
+        with ThreadPoolExecutor(max_workers=MAX_READ_WORKERS) as executor:
+            reads = executor.map(_read_text, md_files)
+
+            for file_path, (content, error) in zip(md_files, reads):
+                try:
+                    if error is not None:
+                        raise error
                     rel_path = file_path.relative_to(self.docs_dir)
                     self.documents[str(rel_path)] = {
                         'path': file_path,
                         'content': content,
-                        'lines': content.split('\n')
+                        # Newline offsets, so a match's line number is a
+                        # binary search instead of a count over its prefix,
+                        # and line context is sliced without splitting lines
+                        'newlines': array('l', (m.start() for m in re.finditer('\n', content))),
                     }
-            except Exception as e:
-                print(f"⚠️  Error loading {file_path}: {e}")
+                except Exception as e:
+                    print(f"⚠️  Error loading {file_path}: {e}")
 
         print(f"✅ Loaded {len(self.documents)} documents\n")
 
@@ -48,18 +130,9 @@ class ConsistencyAuditor:
         """Find all mentions of tech stack"""
         print("🔍 Extracting tech stack mentions...")
 
-        tech_patterns = {
-            'Next.js': r'Next\.js\s*(?:v?(\d+(?:\.\d+)*))?',
-            'Supabase': r'Supabase\s*(?:v?(\d+(?:\.\d+)*))?',
-            'React Query': r'React\s+Query\s*(?:v?(\d+(?:\.\d+)*))?|@tanstack/react-query',
-            'Zustand': r'Zustand\s*(?:v?(\d+(?:\.\d+)*))?',
-            'shadcn': r'shadcn(?:/ui)?\s*(?:v?(\d+(?:\.\d+)*))?',
-            'TypeScript': r'TypeScript\s*(?:v?(\d+(?:\.\d+)*))?',
-        }
-
         for doc_path, doc in self.documents.items():
-            for tech, pattern in tech_patterns.items():
-                matches = re.finditer(pattern, doc['content'], re.IGNORECASE)
+            for tech, pattern in TECH_PATTERNS.items():
+                matches = pattern.finditer(doc['content'])
                 for match in matches:
                     version = match.group(1) if match.lastindex else 'unspecified'
                     self.facts['tech_stack'].append({
@@ -73,23 +146,12 @@ class ConsistencyAuditor:
         """Find statements about patterns (should/must/never)"""
         print("🔍 Extracting pattern statements...")
 
-        pattern_keywords = [
-            r'(service|Service)s?\s+(should|SHOULD|must|MUST|MUST NOT|never|NEVER|cannot|CANNOT)',
-            r'(type|Type)s?\s+(should|SHOULD|must|MUST|MUST NOT|never|NEVER)',
-            r'(hook|Hook)s?\s+(should|SHOULD|must|MUST|MUST NOT|never|NEVER)',
-            r'(component|Component)s?\s+(should|SHOULD|must|MUST|MUST NOT|never|NEVER)',
-            r'(DO NOT|❌|anti-pattern|forbidden|prohibited|deprecated)',
-            r'(functional factories|class-based|classes)',
-            r'(ReturnType|explicit interfaces)',
-            r'(global|singleton|stateful)',
-        ]
-
         for doc_path, doc in self.documents.items():
-            for pattern in pattern_keywords:
-                matches = re.finditer(pattern, doc['content'], re.MULTILINE)
+            for pattern in PATTERN_KEYWORDS:
+                matches = pattern.finditer(doc['content'])
                 for match in matches:
-                    line_num = doc['content'][:match.start()].count('\n') + 1
-                    context = self._get_line_context(doc['lines'], line_num)
+                    line_num = self._line_number(doc, match.start())
+                    context = self._get_line_context(doc, line_num)
 
                     self.facts['patterns'].append({
                         'statement': context,
@@ -102,37 +164,25 @@ class ConsistencyAuditor:
         """Find date and status references"""
         print("🔍 Extracting temporal references...")
 
-        temporal_patterns = [
-            r'(Phase\s+\d+)\s+is\s+(\d+%)\s+complete',
-            r'(Week\s+\d+)',
-            r'(Wave\s+\d+)',
-            r'(\d{4}-\d{2}-\d{2})',
-            r'(Status|STATUS):\s*(\w+)',
-            r'(completed?|in[- ]?progress|pending)',
-        ]
-
         for doc_path, doc in self.documents.items():
-            for pattern in temporal_patterns:
-                matches = re.finditer(pattern, doc['content'], re.IGNORECASE)
+            for pattern in TEMPORAL_PATTERNS:
+                matches = pattern.finditer(doc['content'])
                 for match in matches:
-                    line_num = doc['content'][:match.start()].count('\n') + 1
+                    line_num = self._line_number(doc, match.start())
 
                     self.facts['temporal'].append({
                         'reference': match.group(0),
                         'source': doc_path,
                         'line': line_num,
-                        'context': self._get_line_context(doc['lines'], line_num)
+                        'context': self._get_line_context(doc, line_num)
                     })
 
     def validate_cross_references(self):
         """Check all markdown links resolve"""
         print("🔍 Validating cross-references...")
 
-        # Pattern for markdown links: [text](path)
-        link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-
         for doc_path, doc in self.documents.items():
-            matches = re.finditer(link_pattern, doc['content'])
+            matches = LINK_PATTERN.finditer(doc['content'])
             for match in matches:
                 link_text = match.group(1)
                 link_target = match.group(2)
@@ -154,29 +204,32 @@ class ConsistencyAuditor:
 
                 # Check if file exists
                 if not target_path.exists():
-                    line_num = doc['content'][:match.start()].count('\n') + 1
+                    line_num = self._line_number(doc, match.start())
                     self.broken_links.append({
                         'source': doc_path,
                         'line': line_num,
                         'link_text': link_text,
                         'target': link_target,
                         'resolved_path': str(target_path),
-                        'context': self._get_line_context(doc['lines'], line_num)
+                        'context': self._get_line_context(doc, line_num)
                     })
 
     def detect_contradictions(self):
         """Compare extracted facts for conflicts"""
         print("🔍 Detecting contradictions...")
 
+        # Lowercase each statement once for both checks; kept out of the
+        # fact dicts so the report is unchanged
+        lowered = [(f, f['statement'].lower()) for f in self.facts['patterns']]
+
         # Check for contradictory pattern statements
-        service_patterns = [f for f in self.facts['patterns'] if 'service' in f['statement'].lower()]
+        service_patterns = [(f, stmt) for f, stmt in lowered if 'service' in stmt]
 
         # Look for conflicting statements about services
         class_based = []
         functional = []
 
-        for pattern in service_patterns:
-            stmt = pattern['statement'].lower()
+        for pattern, stmt in service_patterns:
             if 'class' in stmt and ('should' in stmt or 'must' in stmt):
                 class_based.append(pattern)
             if 'functional' in stmt or 'functional factories' in stmt:
@@ -194,13 +247,12 @@ class ConsistencyAuditor:
             })
 
         # Check for conflicting type guidance
-        type_patterns = [f for f in self.facts['patterns'] if 'type' in f['statement'].lower() or 'returntype' in f['statement'].lower()]
+        type_patterns = [(f, stmt) for f, stmt in lowered if 'type' in stmt or 'returntype' in stmt]
 
         returntype_allowed = []
         returntype_banned = []
 
-        for pattern in type_patterns:
-            stmt = pattern['statement'].lower()
+        for pattern, stmt in type_patterns:
             if 'returntype' in stmt:
                 if any(word in stmt for word in ['never', 'must not', 'ban', '❌', 'do not']):
                     returntype_banned.append(pattern)
@@ -225,14 +277,19 @@ class ConsistencyAuditor:
         # Compare document titles and content for similarity
         doc_list = list(self.documents.items())
 
+        # Only documents sharing a directory are compared; index them by
+        # directory once rather than testing every pair's parents
+        docs_by_dir = defaultdict(list)
+        for i, (path, _) in enumerate(doc_list):
+            docs_by_dir[Path(path).parent].append(i)
+
         for i, (path1, doc1) in enumerate(doc_list):
-            for path2, doc2 in doc_list[i+1:]:
-                # Skip if same directory suggests intentional organization
-                if Path(path1).parent != Path(path2).parent:
-                    continue
+            same_dir = docs_by_dir[Path(path1).parent]
+            for j in same_dir[bisect_right(same_dir, i):]:
+                path2, doc2 = doc_list[j]
 
                 # Calculate content similarity
-                similarity = self._calculate_similarity(doc1['content'], doc2['content'])
+                similarity = self._calculate_similarity(doc1['content'], doc2['content'], threshold=0.7)
 
                 if similarity > 0.7:  # 70% similar
                     self.redundancy.append({
@@ -242,22 +299,13 @@ class ConsistencyAuditor:
                     })
 
         # Check for repeated explanations of key concepts
-        key_concepts = [
-            'service layer',
-            'type safety',
-            'real-time',
-            'state management',
-            'anti-pattern',
-        ]
-
-        for concept in key_concepts:
+        for concept, pattern in CONCEPT_HEADING_PATTERNS.items():
             occurrences = []
-            pattern = re.compile(rf'#{1,3}\s*.*{re.escape(concept)}.*', re.IGNORECASE)
 
             for doc_path, doc in self.documents.items():
                 matches = pattern.finditer(doc['content'])
                 for match in matches:
-                    line_num = doc['content'][:match.start()].count('\n') + 1
+                    line_num = self._line_number(doc, match.start())
                     # Get the section content (until next heading or end)
                     section_content = self._extract_section(doc['content'], match.start())
                     occurrences.append({
@@ -285,7 +333,7 @@ class ConsistencyAuditor:
 
         for ref in self.facts['temporal']:
             # Look for phase completion percentages
-            match = re.search(r'(Phase\s+\d+)\s+is\s+(\d+)%\s+complete', ref['reference'], re.IGNORECASE)
+            match = PHASE_COMPLETION_PATTERN.search(ref['reference'])
             if match:
                 phase = match.group(1)
                 percentage = int(match.group(2))
@@ -308,26 +356,51 @@ class ConsistencyAuditor:
                         'note': f'Multiple different completion percentages found for {phase}'
                     })
 
+    def _line_number(self, doc: dict, pos: int) -> int:
+        """1-based line number of a position in a loaded document"""
+        return bisect_left(doc['newlines'], pos) + 1
+
     def _get_context(self, content: str, pos: int, chars: int = 100) -> str:
         """Get surrounding context for a position in content"""
         start = max(0, pos - chars)
         end = min(len(content), pos + chars)
         return content[start:end].replace('\n', ' ').strip()
 
-    def _get_line_context(self, lines: List[str], line_num: int, context_lines: int = 2) -> str:
-        """Get surrounding lines for context"""
+    def _get_line_context(self, doc: dict, line_num: int, context_lines: int = 2) -> str:
+        """Get surrounding lines for context, sliced from the document by line offsets"""
+        content, newlines = doc['content'], doc['newlines']
         start = max(0, line_num - context_lines - 1)
-        end = min(len(lines), line_num + context_lines)
-        return '\n'.join(lines[start:end])
-
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
-        """Calculate similarity ratio between two texts"""
-        return SequenceMatcher(None, text1, text2).ratio()
+        end = min(len(newlines) + 1, line_num + context_lines)
+        if start >= end:
+            return ''
+        begin = newlines[start - 1] + 1 if start else 0
+        finish = newlines[end - 1] if end <= len(newlines) else len(content)
+        return content[begin:finish]
+
+    def _calculate_similarity(self, text1: str, text2: str, threshold: float = 0.0) -> float:
+        """Calculate similarity ratio between two texts
+
+        Returns 0.0 without the full comparison when an upper bound on the
+        ratio is already <= threshold, so callers testing ratio > threshold
+        see the same outcome.
+        """
+        # ratio() is 2*matches/total and matches <= the shorter length
+        total = len(text1) + len(text2)
+        if total and 2.0 * min(len(text1), len(text2)) / total <= threshold:
+            return 0.0
+
+        # quick_ratio() bounds matches by shared character counts, at a
+        # fraction of ratio()'s cost
+        matcher = SequenceMatcher(None, text1, text2)
+        if matcher.quick_ratio() <= threshold:
+            return 0.0
+
+        return matcher.ratio()
 
     def _extract_section(self, content: str, start_pos: int) -> str:
         """Extract section content from a heading to the next heading"""
         # Find next heading or end of document
-        next_heading = re.search(r'\n#{1,6}\s', content[start_pos:])
+        next_heading = NEXT_HEADING_PATTERN.search(content[start_pos:])
         if next_heading:
             end_pos = start_pos + next_heading.start()
         else: